@@ -0,0 +1,211 @@
+"""Per-invite benchmark on top of the offline replay harness.
+
+Runs the bot against replay_harness.py, then reports p50/p95 wall time for
+each phase of process_page() (locating the Connect anchor, opening the modal,
+finding "Add a note", filling the note, then the wait for the outcome of
+Send: modal closed, HTTP status and Pending state, awaited together). The
+deliberate random pacing sleeps are reported apart from bot overhead, so the
+numbers show how much of each invite cycle is the bot itself.
+
+Each run is appended to a JSON results file together with a label (release
+tag, commit...), and the overhead is compared with the previous entry so
+regressions between releases stand out.
+
+--note-input both runs the harness once per note input mode and compares the
+time from focusing the textarea to Send being enabled (fill_message_box +
+settle_after_fill).
+
+Usage:
+    python benchmark.py --label v1.4 --pages 3
+    python benchmark.py --no-pacing          # skip the human-pacing sleeps
+    python benchmark.py --note-input both    # CDP insertText vs per-key typing
+"""
+import argparse
+import json
+import logging
+import os
+import subprocess
+import time
+
+from main import LinkedInAutomator, NOTE_INPUT_MODES, setup_logging, logger
+from replay_harness import ReplayHarness, run_replay
+
+
+RESULTS_FILE = "benchmark_results.json"
+
+# Phases in the order they happen in an invite cycle (others are appended)
+PHASE_ORDER = (
+    "locate_connect", "click_connect", "settle_after_connect", "get_modal_shadow_root",
+    "find_add_note", "click_add_note", "find_message_box", "fill_message_box",
+    "settle_after_fill", "find_send", "find_send_without_note", "click_send",
+    "wait_send_outcome", "wait_modal_closed", "detect_rate_limit_429", "verify_invitation",
+)
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of a list of numbers (None if empty)."""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    k = (len(ordered) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def summarize(values):
+    """count/p50/p95/mean (seconds) of a list of durations."""
+    return {
+        "count": len(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "mean": sum(values) / len(values) if values else None,
+    }
+
+
+def summarize_timings(invite_timings):
+    """Aggregate LinkedInAutomator.invite_timings into per-phase statistics."""
+    names = [p for p in PHASE_ORDER if any(p in t["phases"] for t in invite_timings)]
+    names += sorted({p for t in invite_timings for p in t["phases"]} - set(names))
+    phases = {name: summarize([t["phases"][name] for t in invite_timings if name in t["phases"]])
+              for name in names}
+    unattributed = [t["overhead"] - sum(t["phases"].values()) for t in invite_timings]
+    return {
+        "invites": len(invite_timings),
+        "cycle_total": summarize([t["total"] for t in invite_timings]),
+        "pacing": summarize([t["pacing"] for t in invite_timings]),
+        "overhead": summarize([t["overhead"] for t in invite_timings]),
+        "unattributed": summarize(unattributed),
+        "phases": phases,
+    }
+
+
+def time_to_send_enabled(invite_timings):
+    """Per-invite seconds from typing the note to Send being enabled."""
+    return [t["phases"]["fill_message_box"] + t["phases"].get("settle_after_fill", 0.0)
+            for t in invite_timings if "fill_message_box" in t["phases"]]
+
+
+def _git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"],
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+
+def load_results(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_result(path, entry):
+    """Append one run to the JSON results file (a list of runs)."""
+    results = load_results(path)
+    results.append(entry)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    return results
+
+
+def print_report(summary, previous=None):
+    """Print the phase table; compare overhead p50 with the previous run."""
+    def ms(v):
+        return "      -" if v is None else f"{v * 1000:7.0f}"
+
+    print(f"\nInvites measured: {summary['invites']}")
+    print(f"{'phase':<26}{'n':>5}{'p50 ms':>9}{'p95 ms':>9}")
+    for name, stats in summary["phases"].items():
+        print(f"{name:<26}{stats['count']:>5}  {ms(stats['p50'])}  {ms(stats['p95'])}")
+    print("-" * 49)
+    for key in ("unattributed", "overhead", "pacing", "cycle_total"):
+        stats = summary[key]
+        print(f"{key:<26}{stats['count']:>5}  {ms(stats['p50'])}  {ms(stats['p95'])}")
+
+    if previous and previous["summary"]["overhead"]["p50"] and summary["overhead"]["p50"]:
+        before = previous["summary"]["overhead"]["p50"]
+        after = summary["overhead"]["p50"]
+        change = (after - before) / before * 100
+        print(f"\nOverhead p50 vs previous run ({previous.get('label') or previous.get('revision')}): "
+              f"{before * 1000:.0f} ms -> {after * 1000:.0f} ms ({change:+.1f}%)")
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark per-invite phase timings on the replay harness")
+    parser.add_argument("--pages", type=int, default=2, help="Fixture pages to process (default: 2)")
+    parser.add_argument("--label", default=None, help="Label stored with the results (e.g. a release tag)")
+    parser.add_argument("--output", default=RESULTS_FILE,
+                        help=f"JSON file the results are appended to (default: {RESULTS_FILE})")
+    parser.add_argument("--no-pacing", action="store_true",
+                        help="Disable the random human-pacing sleeps (they are reported separately anyway)")
+    parser.add_argument("-m", "--message", default="message.txt",
+                        help="Path to message template file (default: message.txt)")
+    parser.add_argument("-n", "--no-message", action="store_true", help="Send invitations without a note")
+    parser.add_argument("--note-input", default="insert", choices=NOTE_INPUT_MODES + ("both",),
+                        help="How the note is entered (default: insert); 'both' runs and compares each mode")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    parser.add_argument("-l", "--log-level", default="WARN", choices=["DEBUG", "INFO", "WARN", "ERROR"],
+                        help="Console/file log verbosity (default: WARN)")
+    return parser.parse_args()
+
+
+def run_benchmark(args, note_input):
+    """Run the harness once and return the results entry."""
+    harness = ReplayHarness(pages=args.pages)
+    harness.start()
+    automator = LinkedInAutomator(use_existing_browser=False, headless=not args.headed,
+                                  auto_continue=True, message_file=args.message,
+                                  no_message=args.no_message, ledger_file=None,
+                                  checkpoint_file=None, click_stats_file=None,
+                                  note_input=note_input)
+    if args.no_pacing:
+        automator.pacing_scale = 0.0
+
+    started = time.time()
+    try:
+        run_replay(automator, harness)
+    finally:
+        automator.close()
+        harness.stop()
+
+    return {
+        "label": args.label,
+        "revision": _git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(started)),
+        "config": {"pages": args.pages, "no_message": args.no_message, "pacing": not args.no_pacing,
+                   "note_input": note_input},
+        "summary": summarize_timings(automator.invite_timings),
+        "send_enabled": summarize(time_to_send_enabled(automator.invite_timings)),
+        "invites": automator.invite_timings,
+    }
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    level_name = "WARNING" if args.log_level == "WARN" else args.log_level
+    setup_logging(level=getattr(logging, level_name, logging.WARNING))
+
+    modes = NOTE_INPUT_MODES if args.note_input == "both" else (args.note_input,)
+    entries = []
+    for mode in modes:
+        entry = run_benchmark(args, mode)
+        previous = load_results(args.output)
+        if len(modes) > 1:
+            print(f"\n=== note input: {mode} ===")
+        print_report(entry["summary"], previous[-1] if previous else None)
+        save_result(args.output, entry)
+        entries.append(entry)
+
+    if len(entries) > 1:
+        print("\nTime to Send enabled (fill_message_box + settle_after_fill):")
+        for entry in entries:
+            stats = entry["send_enabled"]
+            p50 = "-" if stats["p50"] is None else f"{stats['p50'] * 1000:.0f} ms"
+            p95 = "-" if stats["p95"] is None else f"{stats['p95'] * 1000:.0f} ms"
+            print(f"  {entry['config']['note_input']:<8} n={stats['count']:<4} p50 {p50:>8}   p95 {p95:>8}")
+
+    logger.info(f"Benchmark results appended to {args.output}")
+    print(f"\nResults appended to {args.output}")
@@ -4,6 +4,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
 import time
 import json
 import random
@@ -13,12 +14,38 @@ import os
 import re
 import unicodedata
 import logging
+import logging.handlers
+import atexit
 import ctypes
+import ctypes.util
+import functools
+import mmap
+import queue
+import select
+import struct
+import threading
+from contextlib import contextmanager
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlparse, parse_qs, urlencode, urlunparse
+
+try:
+    import lxml.html  # optional: faster parse_search_results()
+except ImportError:
+    lxml = None
 
 
 logger = logging.getLogger("linkedin_bot")
 LOG_FILE = "last_run.log"
 
+# Structured, append-only event stream (one JSON object per line) written next
+# to the human-readable log; see setup_event_log() / log_event().
+event_logger = logging.getLogger("linkedin_bot.events")
+EVENTS_FILE = "events.jsonl"
+_event_listener = None
+LEDGER_FILE = "invite_ledger.jsonl"
+CHECKPOINT_FILE = "run_checkpoint.json"
+CLICK_STATS_FILE = "click_stats.json"
+
 # URL fragments of the LinkedIn endpoint that actually creates an invitation.
 # When you've exhausted your invite quota this endpoint answers HTTP 429
 # (Too Many Requests) - sometimes WITHOUT any "limit reached" dialog in the UI.
@@ -28,6 +55,23 @@ INVITE_ENDPOINT_FRAGMENTS = (
     "verifyQuotaAndCreate",
 )
 
+# Performance-log profiles (--perf-log). "network" records only the Network
+# domain, which is all the 429 detection needs; "all" is Chrome's default
+# (Network + Page/timeline events); "off" disables performance logging.
+PERF_LOG_PROFILES = ("network", "all", "off")
+
+# How fill_message_box enters the note (--note-input). "insert" inserts all
+# but the last few characters with CDP Input.insertText and types the rest;
+# "keys" types every character with send_keys (one key event per character).
+NOTE_INPUT_MODES = ("insert", "keys")
+
+# How the bot moves between result pages (--navigation). "url" loads the search
+# URL with the next page= value; "click" clicks LinkedIn's Next/Previous button.
+NAVIGATION_MODES = ("url", "click")
+
+# LinkedIn never serves people-search results past this page
+LAST_RESULTS_PAGE = 100
+
 # Windows power management constants for sleep prevention
 _ES_CONTINUOUS = 0x80000000
 _ES_SYSTEM_REQUIRED = 0x00000001
@@ -64,50 +108,1175 @@ def setup_logging(level=logging.DEBUG, log_file=LOG_FILE):
     return logger
 
 
+class _JsonLineFormatter(logging.Formatter):
+    """Render an event dict (the log record's msg) as one JSON line."""
+
+    def format(self, record):
+        return json.dumps(record.msg, ensure_ascii=False, default=str)
+
+
+def setup_event_log(path=EVENTS_FILE):
+    """Start the structured JSONL event log (appended to, never overwritten).
+
+    Records go through a QueueHandler into an in-memory queue and a
+    QueueListener thread does the file I/O, so log_event() never blocks the
+    invite loop on disk writes. Pass a falsy path to disable the event log.
+    """
+    stop_event_log()
+    event_logger.handlers.clear()
+    event_logger.propagate = False
+    event_logger.setLevel(logging.INFO)
+    if not path:
+        return
+
+    file_handler = logging.FileHandler(path, mode="a", encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter("%(message)s"))
+    event_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(event_queue)
+    queue_handler.setFormatter(_JsonLineFormatter())
+    event_logger.addHandler(queue_handler)
+
+    global _event_listener
+    _event_listener = logging.handlers.QueueListener(event_queue, file_handler)
+    _event_listener.start()
+
+
+@atexit.register
+def stop_event_log():
+    """Flush queued events to disk and stop the event log writer thread."""
+    global _event_listener
+    if _event_listener is not None:
+        _event_listener.stop()
+        _event_listener.handlers[0].close()
+        _event_listener = None
+
+
+def log_event(event, **fields):
+    """Append one structured event ({"ts", "event", **fields}) to the event log."""
+    if not event_logger.handlers:
+        return
+    event_logger.info({"ts": time.strftime("%Y-%m-%dT%H:%M:%S"), "event": event, **fields})
+
+
+@functools.lru_cache(maxsize=8192)
 def _normalize_name_token(token):
-    """Lowercase and strip accents so 'Júlia' and 'Julia' compare equal."""
+    """Lowercase and strip accents so 'Júlia' and 'Julia' compare equal.
+
+    Memoized: the same few hundred tokens come back on every page.
+    """
+    lowered = token.lower()
+    if lowered.isascii():
+        return lowered  # nothing to strip
     return ''.join(
-        c for c in unicodedata.normalize('NFD', token.lower())
+        c for c in unicodedata.normalize('NFD', lowered)
         if unicodedata.category(c) != 'Mn')
 
 
-# Connectors that can appear inside a compound first name (e.g. "Maria de Lourdes")
-NAME_CONNECTORS = {"de", "da", "do", "das", "dos", "e"}
-
-# Common Brazilian given names that frequently appear as the SECOND part of a
-# compound first name. Stored accent-stripped and lowercase. If a person's second
-# token is in this set we keep it (João + Victor); a surname (Silva, Santos...) is
-# not in the set, so it is dropped (just João).
-COMPOUND_GIVEN_NAMES = {
-    _normalize_name_token(n) for n in [
-        # masculine
-        "Victor", "Vitor", "Henrique", "Eduardo", "Gabriel", "Felipe", "Miguel",
-        "Lucas", "Luiz", "Luis", "Carlos", "Paulo", "Pedro", "Antonio", "Jose",
-        "Augusto", "Cesar", "Otavio", "Vinicius", "Heitor", "Davi", "David",
-        "Bernardo", "Arthur", "Artur", "Theo", "Benicio", "Samuel", "Isaac",
-        "Gustavo", "Mateus", "Matheus", "Joao", "Ricardo", "Rodrigo", "Marcelo",
-        "Marcos", "Marco", "Andre", "Alexandre", "Leonardo", "Leandro", "Fabio",
-        "Bruno", "Diego", "Thiago", "Tiago", "Rafael", "Sergio", "Emanuel",
-        "Enzo", "Lorenzo", "Murilo", "Nicolas", "Breno", "Caio", "Kaua", "Kauan",
-        "Francisco", "Vicente", "Daniel", "Fernando", "Junior", "Filho", "Neto",
-        # feminine
-        "Julia", "Eduarda", "Gabriela", "Clara", "Helena", "Beatriz", "Fernanda",
-        "Cristina", "Lucia", "Vitoria", "Sofia", "Sophia", "Manuela", "Alice",
-        "Laura", "Leticia", "Rafaela", "Daniela", "Carolina", "Luiza", "Luisa",
-        "Mariana", "Marina", "Marcela", "Juliana", "Adriana", "Patricia",
-        "Priscila", "Vanessa", "Viviane", "Simone", "Sandra", "Debora", "Deborah",
-        "Raquel", "Sara", "Sarah", "Tatiana", "Michele", "Michelle", "Isabel",
-        "Isabela", "Isabella", "Valentina", "Cecilia", "Antonella", "Elisa",
-        "Livia", "Melissa", "Yasmin", "Agatha", "Esther", "Ester", "Lais", "Lara",
-        "Lourdes", "Aparecida", "Conceicao", "Regina", "Teresa", "Tereza", "Rosa",
-        "Ana", "Maria", "Emanuelly", "Gabrielly", "Vitoria", "Flavia", "Camila",
-        "Bianca", "Larissa", "Amanda", "Aline", "Bruna", "Carla", "Paula",
-    ]
+# Given-name dictionaries, one per locale: names/<locale>.txt holds one
+# accent-stripped, lowercase given name per line, sorted by UTF-8 bytes, and
+# names/<locale>.connectors.txt the connectors that can appear inside a
+# compound first name ("de" in "Maria de Lourdes"). A person's second token is
+# kept only if it is a known given name (João + Victor); a surname (Silva,
+# Santos...) is not in the list, so it is dropped (just João).
+NAMES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "names")
+DEFAULT_NAME_LOCALES = ("pt",)
+
+
+def write_word_list(words, path):
+    """Write words as a SortedWordList file (normalized, de-duplicated, sorted)."""
+    normalized = {_normalize_name_token(w.strip()) for w in words if w.strip()}
+    with open(path, "w", encoding="utf-8") as f:
+        for word in sorted(normalized, key=lambda w: w.encode("utf-8")):
+            f.write(word + "\n")
+
+
+class SortedWordList:
+    """Membership tests against a sorted word file, without loading it.
+
+    The file is memory-mapped on first use and searched by bisection over its
+    line boundaries, so even a dictionary with tens of thousands of names
+    costs a little page cache instead of a Python set of strings, and nothing
+    at all until the first lookup. A file that turns out not to be sorted or
+    normalized (e.g. edited by hand) is loaded into a set instead, with a
+    warning; write_word_list() produces a proper one.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+        self._map = None
+        self._words = None  # set fallback for unsorted files
+        self._loaded = False
+
+    def _load(self):
+        self._loaded = True
+        try:
+            self._file = open(self.path, "rb")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file: nothing to map
+            self._words = set()
+            return
+        except OSError as e:
+            logger.warning(f"Could not open name list '{self.path}': {e}")
+            self._words = set()
+            return
+
+        previous = b""
+        self._map.seek(0)
+        for raw in iter(self._map.readline, b""):
+            line = raw.rstrip(b"\r\n")
+            word = line.decode("utf-8", "replace")
+            if line < previous or word != _normalize_name_token.__wrapped__(word):
+                logger.warning(f"Name list '{self.path}' is not sorted/normalized; "
+                               f"loading it into memory instead")
+                self._map.seek(0)
+                self._words = {_normalize_name_token(w.decode("utf-8", "replace").strip())
+                               for w in iter(self._map.readline, b"")}
+                self._words.discard("")
+                self.close()
+                return
+            previous = line
+
+    def __contains__(self, word):
+        """word must already be normalized (see _normalize_name_token)."""
+        if not self._loaded:
+            self._load()
+        if self._words is not None:
+            return word in self._words
+        target = word.encode("utf-8")
+        mm = self._map
+        lo, hi = 0, len(mm)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = mm.rfind(b"\n", 0, mid) + 1
+            end = mm.find(b"\n", start)
+            if end == -1:
+                end = len(mm)
+            line = mm[start:end].rstrip(b"\r")
+            if line == target:
+                return True
+            if line < target:
+                lo = end + 1
+            else:
+                hi = start
+        return False
+
+    def __len__(self):
+        if not self._loaded:
+            self._load()
+        if self._words is not None:
+            return len(self._words)
+        self._map.seek(0)
+        return sum(1 for line in iter(self._map.readline, b"") if line.strip())
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class NameDictionary:
+    """Given names and connectors for the selected locales, loaded on first use.
+
+    Given-name answers are memoized per token, so the bisection over the
+    word lists only runs the first time a token is seen.
+    """
+
+    def __init__(self, locales=DEFAULT_NAME_LOCALES, directory=NAMES_DIR):
+        self.locales = tuple(locales)
+        self.directory = directory
+        self._given = None
+        self._connectors = None
+        self.is_given_name = functools.lru_cache(maxsize=8192)(self._is_given_name)
+
+    def _load(self):
+        self._given, self._connectors = [], set()
+        for locale in self.locales:
+            path = os.path.join(self.directory, f"{locale}.txt")
+            if os.path.exists(path):
+                self._given.append(SortedWordList(path))
+            else:
+                logger.warning(f"No given-name list for locale '{locale}' ({path})")
+            connectors_path = os.path.join(self.directory, f"{locale}.connectors.txt")
+            if os.path.exists(connectors_path):
+                with open(connectors_path, "r", encoding="utf-8") as f:
+                    self._connectors.update(_normalize_name_token(w) for w in f.read().split())
+
+    def _is_given_name(self, token):
+        if self._given is None:
+            self._load()
+        word = _normalize_name_token(token)
+        return any(word in names for names in self._given)
+
+    def is_connector(self, token):
+        if self._connectors is None:
+            self._load()
+        return _normalize_name_token(token) in self._connectors
+
+    def __len__(self):
+        if self._given is None:
+            self._load()
+        return sum(len(names) for names in self._given)
+
+    def close(self):
+        for names in self._given or []:
+            names.close()
+
+
+name_dictionary = NameDictionary()
+
+
+def set_name_locales(locales, directory=NAMES_DIR):
+    """Switch the given-name dictionary to other locales (e.g. ("pt", "es"))."""
+    global name_dictionary
+    name_dictionary.close()
+    name_dictionary = NameDictionary(locales, directory)
+    resolve_first_name.cache_clear()
+    first_name_from_aria_label.cache_clear()
+
+
+# "Invite <Full Name> to connect" - the Connect anchor's aria-label
+INVITE_LABEL_PATTERN = re.compile(r"Invite\s+(.+?)\s+to connect", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
+def resolve_first_name(full_name):
+    """Return the name to use in the {name} placeholder.
+
+    Usually just the first token, but keeps compound first names ("João
+    Victor", "Ana Júlia", "Maria de Lourdes"): the extra token is included
+    only when it is itself a known given name, so surnames (Silva, Santos)
+    are dropped. Memoized per full name; a given-name lookup is a bisection
+    over the name_dictionary word lists, so its cost barely grows with them.
+    """
+    if not full_name:
+        return ""
+    tokens = full_name.split()
+    if not tokens:
+        return ""
+    first = tokens[0]
+    if len(tokens) == 1:
+        return first
+
+    # "Maria de Lourdes" -> keep connector + following given name
+    if name_dictionary.is_connector(tokens[1]) and len(tokens) >= 3:
+        if name_dictionary.is_given_name(tokens[2]):
+            return f"{first} {tokens[1]} {tokens[2]}"
+        return first
+
+    # "João Victor" -> keep second token only if it's a given name
+    if name_dictionary.is_given_name(tokens[1]):
+        return f"{first} {tokens[1]}"
+
+    return first
+
+
+def full_name_from_aria_label(aria_label):
+    """Full name from an 'Invite <Full Name> to connect' label, or None."""
+    match = INVITE_LABEL_PATTERN.match(aria_label) if aria_label else None
+    return (match.group(1).strip() or None) if match else None
+
+
+@functools.lru_cache(maxsize=4096)
+def first_name_from_aria_label(aria_label):
+    """First name from an 'Invite <Full Name> to connect' label, or None."""
+    full_name = full_name_from_aria_label(aria_label)
+    return resolve_first_name(full_name) if full_name else None
+
+
+def first_names_from_aria_labels(aria_labels):
+    """Batch version of first_name_from_aria_label: {label: first name or None}."""
+    return {label: first_name_from_aria_label(label) for label in aria_labels}
+
+
+# Placeholders a note template may use. {name} is the display first name;
+# {title} and {company} come from the search result's "Current: <title> at
+# <company>" line or headline (see parse_headline).
+TEMPLATE_SLOTS = ("name", "company", "title")
+
+# LinkedIn's note limit, in UTF-16 code units (see _utf16_length)
+NOTE_LIMIT = 300
+
+
+def _utf16_length(text):
+    """Length the way LinkedIn counts it: UTF-16 code units (an emoji is 2)."""
+    return len(text.encode('utf-16-le')) // 2
+
+
+class MessageTemplate:
+    """A note template parsed once, at load time, into literals, slots and segments.
+
+    {name} is optional: it keeps its leading comma and whitespace, so leaving
+    it out drops them too ("Olá!" rather than "Olá, !"). {title} and
+    {company} are required: a template that uses them outside a segment can
+    only be rendered when both values are known, since dropping just the
+    placeholder would leave "...você é  na ." behind. Text in square brackets
+    around a placeholder is an optional segment, kept or dropped as a whole:
+    "Oi {name}[, vi que você é {title}][ na {company}]!" renders without
+    the missing parts. The UTF-16 length of every fixed piece is computed
+    here, so the 300-unit fit check per invite only has to measure the values.
+    """
+
+    SLOT = re.compile(r"(,?\s*)\{(" + "|".join(TEMPLATE_SLOTS) + r")\}")
+    SEGMENT = re.compile(r"\[([^\[\]]*\{(?:" + "|".join(TEMPLATE_SLOTS) + r")\}[^\[\]]*)\]")
+    ANY_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+    # Slots that may be left out on their own (with their lead)
+    OPTIONAL_SLOTS = ("name",)
+
+    def __init__(self, text):
+        self.text = text
+        # Placeholders that would be sent literally (typos such as {nome})
+        self.unknown_slots = tuple(sorted(
+            set(self.ANY_PLACEHOLDER.findall(text)) - set(TEMPLATE_SLOTS)))
+        # Parts, in order: (literal, None, length), (slot, lead, lead length)
+        # or (segment pieces, "segment", fixed length), where segment pieces
+        # alternate literal, slot, literal, ...
+        parts = []
+        pieces = self.SEGMENT.split(text)  # text, segment, text, segment, ..., text
+        for i, piece in enumerate(pieces):
+            if i % 2:
+                segment = tuple(re.split(r"\{(" + "|".join(TEMPLATE_SLOTS) + r")\}", piece))
+                parts.append((segment, "segment", sum(_utf16_length(t) for t in segment[0::2])))
+                continue
+            sub = self.SLOT.split(piece)  # literal, lead, slot, literal, ...
+            for j, chunk in enumerate(sub):
+                if j % 3 == 0:
+                    if chunk:
+                        parts.append((chunk, None, _utf16_length(chunk)))
+                elif j % 3 == 2:
+                    parts.append((chunk, sub[j - 1], _utf16_length(sub[j - 1])))
+        self.parts = tuple(parts)
+        self.required_slots = frozenset(
+            slot for slot, kind, _ in parts
+            if kind not in (None, "segment") and slot not in self.OPTIONAL_SLOTS)
+        self.fixed_length = sum(length for _, kind, length in parts if kind is None)
+
+    def _part_length(self, part, values):
+        """UTF-16 length a part adds (0 if it has to be left out)."""
+        content, kind, length = part
+        if kind is None:
+            return length
+        if kind == "segment":
+            slots = content[1::2]
+            if not all(values.get(slot) for slot in slots):
+                return 0
+            return length + sum(_utf16_length(values[slot]) for slot in slots)
+        value = values.get(content)
+        return length + _utf16_length(value) if value else 0
+
+    def render(self, values, limit=NOTE_LIMIT):
+        """Fill the template, dropping optional parts that don't fit.
+
+        Parts without a value are left out. If the note is still over
+        `limit`, the optional parts are dropped one at a time, the longest
+        first, until it fits. Returns (text, names of the slots dropped to
+        fit), or (None, ()) when a required slot has no value or the note
+        can't fit without one.
+        """
+        if not all(values.get(slot) for slot in self.required_slots):
+            return None, ()
+        lengths = [self._part_length(part, values) for part in self.parts]
+        length = sum(lengths)
+        dropped = set()
+        while length > limit:
+            optional = [i for i, (_, kind, _) in enumerate(self.parts)
+                        if kind is not None and i not in dropped and lengths[i]
+                        and (kind == "segment" or self.parts[i][0] in self.OPTIONAL_SLOTS)]
+            if not optional:
+                return None, ()
+            longest = max(optional, key=lambda i: lengths[i])
+            dropped.add(longest)
+            length -= lengths[longest]
+
+        out, omitted = [], []
+        for i, (part, (content, kind, _)) in enumerate(zip(lengths, self.parts)):
+            if i in dropped:
+                omitted.extend(content[1::2] if kind == "segment" else (content,))
+            elif not part:
+                continue
+            elif kind is None:
+                out.append(content)
+            elif kind == "segment":
+                out.extend(values[p] if j % 2 else p for j, p in enumerate(content))
+            else:
+                out.append(kind)
+                out.append(values[content])
+        return "".join(out), tuple(omitted)
+
+
+# "<title> at <company>", as in "Current: Tech Recruiter at Acme - Recrutamento"
+HEADLINE_AT = re.compile(r"^(?P<title>.+?)\s+(?:at|@)\s+(?P<company>.+)$", re.IGNORECASE)
+# Where a company name stops: " - tagline", " | more", " · more", ", more"
+COMPANY_END = re.compile(r"\s+[-|·•]\s+|,\s")
+
+
+def parse_headline(current=None, headline=None):
+    """(title, company) from a result row's "Current:" line or headline.
+
+    Either may be None. For a "A | B at C" title only the first part is
+    kept, so {title} stays short.
+    """
+    for text in (current, headline):
+        if not text:
+            continue
+        text = text.strip()
+        if text.lower().startswith("current:"):
+            text = text[len("current:"):].strip()
+        match = HEADLINE_AT.match(text)
+        if match:
+            title = match.group("title").split("|")[0].strip()
+            company = COMPANY_END.split(match.group("company"), 1)[0].strip()
+            return title or None, company or None
+    if headline:
+        return headline.split("|")[0].strip() or None, None
+    return None, None
+
+
+# Row states of a search result, matched against the aria-label of the row's
+# action controls in this order (same rules as LinkedInAutomator.CANDIDATES_JS)
+CANDIDATE_RULES = (
+    ("connect", re.compile(r"^Invite (.+) to connect$")),
+    ("pending", re.compile(r"^Pending, click to withdraw invitation sent to (.+)$")),
+    ("message", re.compile(r"^(?:Send a message to|Message) (.+)$")),
+    ("follow", re.compile(r"^Follow (.+)$")),
+)
+
+_VOID_TAGS = frozenset(("area", "base", "br", "col", "embed", "hr", "img", "input",
+                        "link", "meta", "param", "source", "track", "wbr"))
+
+
+class _HtmlNode:
+    """Element of the tree built by _HtmlTreeBuilder.
+
+    Implements the small part of the lxml.html element API that
+    parse_search_results() uses, so the same code walks either tree.
+    """
+
+    __slots__ = ("tag", "attrib", "children", "parent")
+
+    def __init__(self, tag, attrib, parent):
+        self.tag = tag
+        self.attrib = attrib
+        self.children = []  # _HtmlNode or str, in document order
+        self.parent = parent
+
+    def get(self, name, default=None):
+        return self.attrib.get(name, default)
+
+    def getparent(self):
+        return self.parent
+
+    def iter(self, *tags):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if not tags or node.tag in tags:
+                yield node
+            stack.extend(reversed([c for c in node.children if isinstance(c, _HtmlNode)]))
+
+    def itertext(self):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                yield node
+            else:
+                stack.extend(reversed(node.children))
+
+
+class _HtmlTreeBuilder(HTMLParser):
+    """Standard-library fallback for parse_search_results() when lxml is missing."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = _HtmlNode("#document", {}, None)
+        self.current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        node = _HtmlNode(tag, {k: v or "" for k, v in attrs}, self.current)
+        self.current.children.append(node)
+        if tag not in _VOID_TAGS:
+            self.current = node
+
+    def handle_startendtag(self, tag, attrs):
+        self.current.children.append(_HtmlNode(tag, {k: v or "" for k, v in attrs}, self.current))
+
+    def handle_endtag(self, tag):
+        # Close up to the matching open element; stray end tags are ignored
+        node = self.current
+        while node is not None and node.tag != tag:
+            node = node.parent
+        if node is not None and node.parent is not None:
+            self.current = node.parent
+
+    def handle_data(self, data):
+        if self.current.tag not in ("script", "style"):
+            self.current.children.append(data)
+
+
+def _parse_html(page_source):
+    """Root element of page_source, parsed with lxml if installed."""
+    if lxml is not None:
+        return lxml.html.fromstring(page_source)
+    builder = _HtmlTreeBuilder()
+    builder.feed(page_source)
+    builder.close()
+    return builder.root
+
+
+def _element_text(element):
+    """Whitespace-collapsed text of an element (close to innerText)."""
+    return " ".join("".join(element.itertext()).split())
+
+
+def parse_search_results(page_source, base_url="https://www.linkedin.com/"):
+    """Result rows of a saved search page, parsed in-process.
+
+    Offline counterpart of LinkedInAutomator.snapshot_candidates() for
+    read-only analysis: returns the same dicts (label, href, name, state,
+    headline, current) from the HTML of driver.page_source or a saved file,
+    with no WebDriver round-trips. Uses lxml when it is installed and the
+    standard library's html.parser otherwise. Unlike CANDIDATES_JS, the
+    fallback for pages without role="listitem" rows also accepts a <button>
+    Connect control, which is what the older results layout used.
+    """
+    root = _parse_html(page_source)
+    rows = [el for el in root.iter("div") if el.get("role") == "listitem"]
+    connect_tags = ("a",)
+    if not rows:
+        connect_tags = ("a", "button")
+        seen = set()
+        for control in root.iter(*connect_tags):
+            if not CANDIDATE_RULES[0][1].match(control.get("aria-label") or ""):
+                continue
+            row = control.getparent()
+            node = row
+            while node is not None and node.tag != "li":
+                node = node.getparent()
+            row = node if node is not None else row
+            if id(row) not in seen:
+                seen.add(id(row))
+                rows.append(row)
+
+    out = []
+    for row in rows:
+        controls = [c for c in row.iter("a", "button") if c.get("aria-label") is not None]
+        state, label, name = "unknown", None, None
+        for kind, pattern in CANDIDATE_RULES:
+            for control in controls:
+                if kind == "connect" and control.tag not in connect_tags:
+                    continue
+                match = pattern.match(control.get("aria-label"))
+                if match:
+                    state, label, name = kind, control.get("aria-label"), match.group(1).strip()
+                    break
+            if label is not None:
+                break
+
+        profile = next((a for a in row.iter("a") if "linkedin.com/in/" in (a.get("href") or "")), None)
+        if not name and profile is not None:
+            span = next((s for s in profile.iter("span") if s.get("aria-hidden") == "true"), profile)
+            name = next((t.strip() for t in span.itertext() if t.strip()), None)
+
+        # Headline is the paragraph right after the one with the name
+        texts = [t for t in (_element_text(p) for p in row.iter("p")) if t]
+        name_at = next((i for i, t in enumerate(texts) if name and name in t), -1)
+        out.append({
+            "label": label,
+            "href": urljoin(base_url, profile.get("href")).split("?")[0] if profile is not None else None,
+            "name": name,
+            "state": state,
+            "headline": texts[name_at + 1] if 0 <= name_at < len(texts) - 1 else None,
+            "current": next((t for t in texts if t.lower().startswith("current:")), None),
+        })
+    return out
+
+
+class InvitationLedger:
+    """On-disk record of every profile the bot has already dealt with.
+
+    An append-only JSONL file (one {"key", "label", "outcome", "ts"} object per
+    line) plus an in-memory dict index built once at startup, so lookups are
+    O(1). Lines are appended by a background thread, so the invite cycle never
+    waits on the disk; a crash can at worst lose the few lines still queued
+    (close() flushes them, and runs at exit). The key is the profile URL when
+    known, else the normalized full name. If a profile shows up more than
+    once, the latest line wins.
+    """
+
+    # Outcomes that mean "don't bother with this person again". Transient modal
+    # glitches (missing button/textarea) are recorded but retried next run.
+    FINAL_OUTCOMES = {"sent", "failed", "skipped-email", "skipped-no-modal"}
+
+    def __init__(self, path=LEDGER_FILE):
+        self.path = path
+        self._index = {}
+        # Set when the file ends mid-line, so the next record starts on its own line
+        self._needs_newline = False
+        # Lines written to the file so far (queued records not included)
+        self.line_count = 0
+        self._load()
+        # Appends are written by a background thread, off the invite cycle
+        self._pending = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="ledger-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        bad = 0
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                self.line_count += 1
+                self._needs_newline = not line.endswith("\n")
+                try:
+                    record = json.loads(line)
+                    self._index[record["key"]] = record
+                except Exception:
+                    bad += 1  # e.g. a half-written last line after a crash
+        logger.info(f"Ledger '{self.path}': {len(self._index)} known profile(s)"
+                    + (f", {bad} unreadable line(s) ignored" if bad else ""))
+
+    @staticmethod
+    def key_for(href=None, name=None):
+        """Ledger key: the profile URL (no query, no trailing slash), else the name."""
+        if href:
+            return href.split("?")[0].rstrip("/").lower()
+        if name:
+            return "name:" + _normalize_name_token(" ".join(name.split()))
+        return None
+
+    def get(self, key):
+        return self._index.get(key)
+
+    def should_skip(self, key):
+        """True if this profile already has a final outcome in the ledger."""
+        record = self._index.get(key)
+        return record is not None and record["outcome"] in self.FINAL_OUTCOMES
+
+    def record(self, key, outcome, label=None):
+        """Index an outcome for key and queue it for appending to the file."""
+        if not key:
+            return
+        entry = {"key": key, "label": label, "outcome": outcome,
+                 "ts": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        self._index[key] = entry
+        self._pending.put(entry)
+
+    def outcomes_since(self, line):
+        """{outcome: count} of the records after the first `line` lines of the file."""
+        counts = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for number, text in enumerate(f):
+                    if number < line:
+                        continue
+                    try:
+                        outcome = json.loads(text)["outcome"]
+                    except Exception:
+                        continue
+                    counts[outcome] = counts.get(outcome, 0) + 1
+        except OSError as e:
+            logger.warning(f"Could not read ledger '{self.path}': {e}")
+        return counts
+
+    def _write_loop(self):
+        while True:
+            entry = self._pending.get()
+            if entry is None:
+                self._pending.task_done()
+                return
+            try:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    if self._needs_newline:
+                        f.write("\n")
+                        self._needs_newline = False
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                self.line_count += 1
+            except Exception as e:
+                logger.warning(f"Could not write to ledger '{self.path}': {e}")
+            finally:
+                self._pending.task_done()
+
+    def flush(self):
+        """Block until every queued record has been written."""
+        if self._writer is not None:
+            self._pending.join()
+
+    def close(self):
+        """Write out any queued records and stop the writer (safe to call twice)."""
+        if self._writer is None:
+            return
+        self._pending.put(None)
+        self._writer.join(timeout=5)
+        self._writer = None
+
+    def __len__(self):
+        return len(self._index)
+
+
+class ClickStrategyStats:
+    """Per-target-type record of which trusted click strategy works.
+
+    _robust_click tries native -> ActionChains -> CDP. When one of them keeps
+    failing for a kind of target (e.g. native clicks intercepted on the
+    shadow-DOM modal buttons), every invite pays for the failed attempt and its
+    exception. This keeps ok/fail counts per (target type, strategy) plus the
+    strategy that worked most recently, and order() puts that one first.
+
+    The target type is the click description without its parenthesised
+    detail, so "Connect control (Invite Ana to connect)" and "Connect control
+    (Invite Bia to connect)" share statistics. Stats are kept in a small JSON
+    file so what was learned carries over to the next run. It is written when
+    run_automation() ends, however it ends, and again at exit.
+    """
+
+    TRUSTED = ("native", "actionchains", "cdp")
+    _DETAIL = re.compile(r"\s*\(.*\)\s*$")
+
+    def __init__(self, path=CLICK_STATS_FILE):
+        self.path = path
+        # {target_type: {"last": strategy, "strategies": {strategy: {"ok": n, "fail": n}}}}
+        self._stats = {}
+        # Same shape, but only this session's attempts (for the summary)
+        self._session = {}
+        self._load()
+        # Runs usually end with Ctrl+C or an error, never reaching close()
+        atexit.register(self.save)
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._stats = json.load(f)
+            logger.info(f"Click stats '{self.path}': {len(self._stats)} target type(s)")
+        except Exception as e:
+            logger.warning(f"Could not read click stats '{self.path}': {e}")
+            self._stats = {}
+
+    @classmethod
+    def target_type(cls, description):
+        return cls._DETAIL.sub("", description or "element") or "element"
+
+    def order(self, description):
+        """Trusted strategies to try for this target, last winner first."""
+        last = self._stats.get(self.target_type(description), {}).get("last")
+        if last not in self.TRUSTED:
+            return self.TRUSTED
+        return (last,) + tuple(s for s in self.TRUSTED if s != last)
+
+    def record(self, description, strategy, ok):
+        target = self.target_type(description)
+        for stats in (self._stats, self._session):
+            entry = stats.setdefault(target, {"last": None, "strategies": {}})
+            counts = entry["strategies"].setdefault(strategy, {"ok": 0, "fail": 0})
+            counts["ok" if ok else "fail"] += 1
+            if ok and strategy in self.TRUSTED:
+                entry["last"] = strategy
+
+    def save(self):
+        """Write the stats atomically (temp file + rename)."""
+        if not self.path:
+            return
+        try:
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._stats, f, indent=2)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            logger.warning(f"Could not save click stats '{self.path}': {e}")
+
+    def summary_lines(self):
+        """One line per target type clicked this session, with hit rates."""
+        lines = []
+        for target, entry in sorted(self._session.items()):
+            parts = []
+            for strategy, counts in entry["strategies"].items():
+                tries = counts["ok"] + counts["fail"]
+                parts.append(f"{strategy} {counts['ok']}/{tries} ({counts['ok'] / tries:.0%})")
+            lines.append(f"{target}: " + ", ".join(parts))
+        return lines
+
+
+# Light-DOM selectors, by name. Each entry lists the alternatives that used to
+# be written as one long "a | b | c" XPath union (current layout first, legacy
+# fallbacks after); SelectorRegistry tracks them one by one. An alternative is
+# an XPath unless it starts with "css:".
+SELECTORS = {
+    "limit_reached": (
+        "//h2[contains(text(), 'reached the weekly invitation limit')]",
+        "//h2[@id='ip-fuse-limit-alert__header' and contains(text(), 'reached the weekly')]",
+        "//div[contains(@class, 'ip-fuse-limit-alert')]//h2[contains(text(), 'reached')]",
+    ),
+    "limit_close": (
+        "//h2[contains(text(), 'close to the weekly invitation limit')]",
+        "//div[contains(@class, 'ip-fuse-limit-alert')]//h2[contains(text(), 'close to')]",
+    ),
+    "limit_got_it": (
+        "//button[.//span[text()='Got it']]",
+        "//button[contains(@class, 'ip-fuse-limit-alert__primary-action')]",
+    ),
+    "dismiss_button": (
+        "//button[@aria-label='Dismiss']",
+        "//button[contains(@aria-label, 'Dismiss')]",
+    ),
+    # One union alternative: a Pending <a> and a Pending <button> can be on the
+    # same page, and find_all() stops at the first alternative that matches
+    "pending_control": (
+        "//a[contains(@aria-label, 'Pending')] | //button[contains(@aria-label, 'Pending')]",
+    ),
+    "profile_name_spans": (
+        "//a[contains(@href, 'linkedin.com/in/')]//span[@aria-hidden='true']",
+    ),
+    "modal_name_strong": (
+        "//div[@data-test-modal]//div[contains(@class, 'artdeco-modal__content')]//strong",
+        "//div[contains(@class, 'artdeco-modal')]//div[contains(@class, 'artdeco-modal__content')]//strong",
+    ),
+    "modal_name_spans": (
+        "//div[contains(@class, 'artdeco-modal')]//span[@aria-hidden='true']",
+    ),
+    "modal_title": (
+        "//div[contains(@class, 'artdeco-modal')]//h2",
+        "//div[contains(@class, 'artdeco-modal')]//h3",
+        "//div[contains(@class, 'send-invite')]//h2",
+    ),
+    "current_page": (
+        "css:button[aria-current='true']",
+    ),
+    "loading_indicator": (
+        "//div[contains(@class, 'loading')]",
+    ),
 }
 
+
+class SelectorRegistry:
+    """Runs named selectors and learns which of their alternatives still match.
+
+    A lookup is one execute_script call: the browser evaluates the live
+    alternatives in order and stops at the first one that matches, timing
+    each evaluation with performance.now(). Hits, misses and evaluation time
+    are kept per alternative, and alternatives are ordered by hit count, so
+    whatever matches on the layout LinkedIn currently serves is tried first.
+
+    Once a sibling alternative has matched, an alternative that has missed
+    retire_after times without a single hit is considered a dead legacy
+    fallback. It is no longer evaluated on normal lookups, only on the slow
+    path: every slow_path_every-th lookup where nothing live matched (and
+    always with thorough=True). A retired alternative that matches there is
+    revived. With all_matches=True every live alternative is evaluated and
+    the matches are concatenated, like the original union.
+    """
+
+    LOOKUP_JS = """
+        const [alternatives, allMatches] = arguments;
+        const results = [];
+        let elements = [];
+        for (const alt of alternatives) {
+            const t0 = performance.now();
+            let found = [];
+            try {
+                if (alt.startsWith("css:")) {
+                    found = Array.from(document.querySelectorAll(alt.slice(4)));
+                } else {
+                    const snap = document.evaluate(alt, document, null,
+                        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                    for (let i = 0; i < snap.snapshotLength; i++) found.push(snap.snapshotItem(i));
+                }
+            } catch (e) {}
+            results.push([found.length, performance.now() - t0]);
+            elements = elements.concat(found);
+            if (found.length && !allMatches) break;
+        }
+        return {results: results, elements: elements};
+    """
+
+    def __init__(self, driver, selectors=SELECTORS, retire_after=20, slow_path_every=10):
+        self.driver = driver
+        self.retire_after = retire_after
+        self.slow_path_every = slow_path_every
+        # {name: [{"selector", "hits", "misses", "ms"}, ...]} in declaration order
+        self._alternatives = {
+            name: [{"selector": sel, "hits": 0, "misses": 0, "ms": 0.0} for sel in alternatives]
+            for name, alternatives in selectors.items()
+        }
+        self._full_misses = {name: 0 for name in selectors}
+
+    def _is_retired(self, name, alt):
+        return (alt["hits"] == 0 and alt["misses"] >= self.retire_after
+                and any(a["hits"] for a in self._alternatives[name]))
+
+    def _live_and_retired(self, name):
+        alternatives = self._alternatives[name]
+        ordered = sorted(alternatives, key=lambda a: -a["hits"])  # stable: ties keep declaration order
+        live = [a for a in ordered if not self._is_retired(name, a)]
+        retired = [a for a in ordered if self._is_retired(name, a)]
+        return live, retired
+
+    def _evaluate(self, alternatives, all_matches):
+        outcome = self.driver.execute_script(
+            self.LOOKUP_JS, [a["selector"] for a in alternatives], all_matches)
+        for alt, (count, ms) in zip(alternatives, outcome["results"]):
+            alt["hits" if count else "misses"] += 1
+            alt["ms"] += ms
+        return outcome["elements"]
+
+    def find_all(self, name, all_matches=False, thorough=False):
+        """Elements matched by the selector `name` (first matching alternative).
+
+        Raises whatever execute_script raises, like find_elements would.
+        """
+        live, retired = self._live_and_retired(name)
+        elements = self._evaluate(live, all_matches) if live else []
+        if elements or not retired:
+            return elements
+
+        self._full_misses[name] += 1
+        if thorough or self._full_misses[name] % self.slow_path_every == 0:
+            elements = self._evaluate(retired, all_matches)
+            if elements:
+                logger.debug(f"Selector '{name}': a retired alternative matched again")
+        return elements
+
+    def find(self, name, **kwargs):
+        """First element matched by the selector `name`, or None."""
+        elements = self.find_all(name, **kwargs)
+        return elements[0] if elements else None
+
+    def summary_lines(self):
+        """Per-alternative hit/miss counts and mean evaluation time."""
+        lines = []
+        for name, alternatives in self._alternatives.items():
+            for i, alt in enumerate(alternatives):
+                runs = alt["hits"] + alt["misses"]
+                if not runs:
+                    continue
+                state = " (retired)" if self._is_retired(name, alt) else ""
+                lines.append(f"{name}[{i}]{state}: {alt['hits']}/{runs} hits, "
+                             f"{alt['ms'] / runs:.2f} ms avg")
+        return lines
+
+
+class FileChangeWatcher:
+    """Background thread that notices when a file is modified.
+
+    On Linux it uses inotify (through libc, no extra dependency) on the file's
+    directory, so it catches both in-place writes and the write-temp-then-
+    rename saves most editors do. Elsewhere, or if inotify can't be set up,
+    it polls the file's mtime/size/inode every `interval` seconds. It only
+    raises a flag; the owner calls changed() at a safe point and does the
+    reload itself.
+    """
+
+    # inotify event masks (see <sys/inotify.h>)
+    IN_MODIFY = 0x002
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    _EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+    def __init__(self, path, interval=1.0):
+        self.path = os.path.abspath(path)
+        self.interval = interval
+        self.backend = None
+        self._changed = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        target = self._run_inotify if self._setup_inotify() else self._run_polling
+        self.backend = "inotify" if target == self._run_inotify else "polling"
+        self._thread = threading.Thread(target=target, name="message-file-watcher", daemon=True)
+        self._thread.start()
+        logger.debug(f"Watching '{self.path}' for changes ({self.backend})")
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def changed(self):
+        """True (once) if the file changed since the last call."""
+        if self._changed.is_set():
+            self._changed.clear()
+            return True
+        return False
+
+    def _setup_inotify(self):
+        self._fd = None
+        if not sys.platform.startswith("linux"):
+            return False
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return False
+            mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+            if libc.inotify_add_watch(fd, os.path.dirname(self.path).encode(), mask) < 0:
+                os.close(fd)
+                return False
+        except Exception as e:
+            logger.debug(f"inotify unavailable ({type(e).__name__}: {e}); polling instead")
+            return False
+        self._fd = fd
+        return True
+
+    def _run_inotify(self):
+        name = os.path.basename(self.path).encode()
+        try:
+            while not self._stop.is_set():
+                readable, _, _ = select.select([self._fd], [], [], self.interval)
+                if not readable:
+                    continue
+                try:
+                    data = os.read(self._fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+                offset = 0
+                while offset < len(data):
+                    _, _, _, length = self._EVENT_HEADER.unpack_from(data, offset)
+                    offset += self._EVENT_HEADER.size
+                    event_name = data[offset:offset + length].rstrip(b"\0")
+                    offset += length
+                    if event_name == name:
+                        self._changed.set()
+        finally:
+            os.close(self._fd)
+
+    def _signature(self):
+        try:
+            st = os.stat(self.path)
+            return st.st_mtime_ns, st.st_size, st.st_ino
+        except OSError:
+            return None
+
+    def _run_polling(self):
+        last = self._signature()
+        while not self._stop.wait(self.interval):
+            current = self._signature()
+            if current != last:
+                last = current
+                self._changed.set()
+
+
+class PerformanceLogConsumer:
+    """Background thread that keeps draining Chrome's performance log.
+
+    Every `interval` seconds it calls get_log("performance") (which also clears
+    Chrome's buffer) and keeps only Network.responseReceived events for the
+    invitation endpoint. Entries are filtered by plain substring checks on the
+    raw JSON text first, so the unrelated bulk of the log is never parsed. The
+    matching responses are published to a thread-safe queue as dicts with url,
+    status, request_id and headers, which makes the 429 check a queue lookup
+    instead of a polling loop on the hot path.
+
+    Every drained entry is looked at, since dropping any could lose the
+    invite response during a burst; the substring pre-filter keeps that cheap.
+    Memory stays flat over long runs because get_log() clears Chrome's buffer
+    and the response queue keeps only the newest max_responses entries.
+    """
+
+    def __init__(self, driver, fragments=INVITE_ENDPOINT_FRAGMENTS, interval=0.25,
+                 max_responses=100):
+        self.driver = driver
+        self.fragments = tuple(fragments)
+        self.interval = interval
+        self.responses = queue.Queue(maxsize=max_responses)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="perf-log-consumer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def clear(self):
+        """Forget responses received so far (call right before a new Send)."""
+        while True:
+            try:
+                self.responses.get_nowait()
+            except queue.Empty:
+                return
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.drain()
+
+    def drain(self):
+        """Read the buffered log once and queue any invite-endpoint responses."""
+        try:
+            raw = self.driver.get_log("performance")
+        except Exception as e:
+            logger.debug(f"Could not read performance log: {type(e).__name__}: {e}")
+            return
+        for entry in raw:
+            text = entry.get("message", "")
+            # Cheap pre-filter on the raw text before paying for json.loads
+            if "Network.responseReceived" not in text:
+                continue
+            if not any(frag in text for frag in self.fragments):
+                continue
+            try:
+                msg = json.loads(text)["message"]
+            except Exception:
+                continue
+            if msg.get("method") != "Network.responseReceived":
+                continue
+            params = msg.get("params", {})
+            response = params.get("response", {})
+            url = response.get("url", "")
+            if not any(frag in url for frag in self.fragments):
+                continue
+            self._publish({
+                "url": url,
+                "status": response.get("status"),
+                "request_id": params.get("requestId"),
+                "headers": response.get("headers", {}),
+            })
+
+    def _publish(self, event):
+        """Queue an event, evicting the oldest one when the queue is full."""
+        while True:
+            try:
+                self.responses.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    self.responses.get_nowait()
+                except queue.Empty:
+                    pass
+
+
 class LinkedInAutomator:
-    def __init__(self, use_existing_browser=False, auto_continue=False, message_file="message.txt", reverse=False, no_message=False):
-        """Initialize the LinkedIn Automator."""
+    def __init__(self, use_existing_browser=False, auto_continue=False, message_file="message.txt", reverse=False, no_message=False,
+                 headless=False, ledger_file=LEDGER_FILE, checkpoint_file=CHECKPOINT_FILE,
+                 click_stats_file=CLICK_STATS_FILE, watch_message_file=True, note_input="insert",
+                 navigation="url",
+                 perf_log_profile="network"):
+        """Initialize the LinkedIn Automator.
+
+        headless only applies to a fresh browser (use_existing_browser=False);
+        the offline replay harness uses it to run without a visible window.
+        ledger_file is the invitation ledger used to skip profiles handled in
+        earlier runs (None disables it). checkpoint_file is where the run's
+        position is saved after every page for --resume (None disables it).
+        click_stats_file keeps the learned click-strategy order across runs
+        (None keeps it for this session only). watch_message_file reloads the
+        message file when it is edited during the run. note_input picks how
+        the note is entered (see NOTE_INPUT_MODES) and navigation how result
+        pages are changed (see NAVIGATION_MODES). perf_log_profile picks what
+        Chrome's performance log records (see PERF_LOG_PROFILES).
+        """
         # Store the browser mode setting
         self.use_existing_browser = use_existing_browser
         # Store whether to auto-continue past warnings
@@ -122,10 +1291,19 @@ class LinkedInAutomator:
         # Enable Chrome performance logging so we can read network responses
         # (Network.responseReceived events) and detect an HTTP 429 from
         # LinkedIn's invitation endpoint - see detect_rate_limit_429().
-        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        if perf_log_profile != "off":
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            if perf_log_profile == "network":
+                # Network domain only: Chrome would otherwise also buffer every
+                # Page/timeline event, which grows chromedriver's memory all day.
+                chrome_options.add_experimental_option(
+                    "perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
 
         if not use_existing_browser:
             # Set up a new browser instance
+            if headless:
+                chrome_options.add_argument("--headless=new")
+                chrome_options.add_argument("--window-size=1280,1024")
             self.driver = webdriver.Chrome(options=chrome_options)  # You can change to Firefox or other browsers
         else:
             # For working with an already opened browser tab
@@ -137,26 +1315,73 @@ class LinkedInAutomator:
         # gracefully and rely on the UI-based limit detection only. This first
         # call also drains any stale network events from before the bot started.
         try:
+            if perf_log_profile == "off":
+                raise RuntimeError("disabled with --perf-log off")
             self.driver.get_log("performance")
             self.perf_logging = True
-            logger.debug("Performance logging enabled; HTTP 429 detection active.")
+            logger.debug(f"Performance logging enabled ({perf_log_profile}); HTTP 429 detection active.")
         except Exception as e:
             self.perf_logging = False
             logger.warning(f"Performance logging unavailable ({type(e).__name__}): "
                            "network-level HTTP 429 detection disabled, "
                            "relying on UI limit checks only.")
 
+        # Drain the performance log continuously in the background so the
+        # per-invite 429 check doesn't have to poll it.
+        self.perf_consumer = None
+        self._send_clicked_at = time.perf_counter()
+        if self.perf_logging:
+            self.perf_consumer = PerformanceLogConsumer(self.driver)
+            self.perf_consumer.start()
+
         # Wait configuration
         self.wait = WebDriverWait(self.driver, 10)
         self.short_wait = WebDriverWait(self.driver, 3)
+        # Named light-DOM selectors with per-alternative hit statistics
+        self.selectors = SelectorRegistry(self.driver)
+
+        # Page navigation mode, and the last page to process (set by run_automation)
+        self.navigation = navigation
+        self.end_page = None
 
         # Load message variations from file (skipped in no-message mode).
+        self.note_input = note_input
+        self.message_file = message_file
         self.message_templates = [] if no_message else self.load_message_templates(message_file)
+        # Name-only note for when no variation can be filled for a person
+        self.fallback_template = MessageTemplate(self.DEFAULT_MESSAGE)
+        self._check_name_only_variation()
+
+        # Pick up edits to the message file between invites, without a restart
+        self.message_watcher = None
+        if watch_message_file and not no_message and message_file and os.path.exists(message_file):
+            self.message_watcher = FileChangeWatcher(message_file)
+            self.message_watcher.start()
 
         # Session counters
         self.connections_sent = 0
         self.connections_failed = 0
         self.connections_skipped = 0
+        self.ledger_skipped = 0
+
+        # Profiles handled in previous runs (sent / failed / dead ends)
+        self.ledger = InvitationLedger(ledger_file) if ledger_file else None
+
+        # Page-level checkpoint used by --resume
+        self.checkpoint_file = checkpoint_file
+
+        # Which trusted click strategy works for each kind of target
+        self.click_stats = ClickStrategyStats(click_stats_file)
+
+        # Per-invite timing records (see _phase/_pace), one dict per candidate
+        # attempted. Human-pacing sleeps are tracked apart from bot overhead so
+        # benchmark.py can tell the two apart.
+        self.invite_timings = []
+        self._invite_timing = None
+        # LinkedIn page number being processed (tagged onto timing records)
+        self._page_number = None
+        # Multiplier applied to the random human-pacing delays (1.0 = normal)
+        self.pacing_scale = 1.0
 
     # A line made up of dashes (e.g. "---") separates one message variation from
     # the next inside the message file.
@@ -169,9 +1394,10 @@ class LinkedInAutomator:
         To look less templated, the bot rotates randomly among several note
         variations. They live in the same file, separated by a line containing
         only dashes ("---"). A file with no separator is just a single variation,
-        preserving the original behaviour. Each variation is trimmed and capped
-        at LinkedIn's 300-char limit. Always returns a list with at least one
-        template (falling back to a default), or [] in no-message mode.
+        preserving the original behaviour. Each variation is trimmed, capped
+        at LinkedIn's 300-char limit and compiled into a MessageTemplate.
+        Always returns a list with at least one template (falling back to a
+        default), or [] in no-message mode.
         """
         try:
             # No note will be sent, so no templates are needed.
@@ -180,33 +1406,85 @@ class LinkedInAutomator:
 
             if not os.path.exists(file_path):
                 logger.warning(f"Message file '{file_path}' not found. Using default message.")
-                return [self.DEFAULT_MESSAGE]
+                return [MessageTemplate(self.DEFAULT_MESSAGE)]
 
-            with open(file_path, 'r', encoding='utf-8') as file:
-                raw = file.read()
-
-            # Split on the dashed separator line and drop empty chunks.
-            variations = [v.strip() for v in self.MESSAGE_SEPARATOR.split(raw)]
-            variations = [v for v in variations if v]
-
-            if not variations:
+            cleaned = self._read_message_variations(file_path)
+            if not cleaned:
                 logger.warning("Message file is empty. Using default message.")
-                return [self.DEFAULT_MESSAGE]
+                return [MessageTemplate(self.DEFAULT_MESSAGE)]
 
-            # Enforce LinkedIn's 300-char cap per variation.
-            cleaned = []
-            for v in variations:
-                if len(v) > 300:
-                    v = v[:300]
-                    logger.warning("A message variation exceeded 300 chars and was truncated.")
-                cleaned.append(v)
+            for template in cleaned:
+                if template.unknown_slots:
+                    logger.warning(f"Unknown placeholder(s) {', '.join(template.unknown_slots)} in "
+                                   f"'{file_path}' will be sent as-is (known: {', '.join(TEMPLATE_SLOTS)})")
 
             logger.info(f"Loaded {len(cleaned)} message variation(s) from '{file_path}'.")
             return cleaned
 
         except Exception as e:
             logger.error(f"Error loading message file: {str(e)}. Using default message.")
-            return [self.DEFAULT_MESSAGE]
+            return [MessageTemplate(self.DEFAULT_MESSAGE)]
+
+    def _read_message_variations(self, file_path):
+        """Parse the message file into MessageTemplates ([] if it has no text).
+
+        Raises OSError / UnicodeDecodeError if the file can't be read.
+        """
+        with open(file_path, 'r', encoding='utf-8') as file:
+            raw = file.read()
+
+        # Split on the dashed separator line and drop empty chunks.
+        variations = [v.strip() for v in self.MESSAGE_SEPARATOR.split(raw)]
+        variations = [v for v in variations if v]
+
+        # Enforce LinkedIn's 300-char cap per variation.
+        cleaned = []
+        for v in variations:
+            if len(v) > 300:
+                v = v[:300]
+                logger.warning("A message variation exceeded 300 chars and was truncated.")
+            cleaned.append(MessageTemplate(v))
+        return cleaned
+
+    def reload_message_templates(self):
+        """Re-read the message file after an edit, between two invites.
+
+        The new variations replace the current ones in a single assignment,
+        and only if the file is readable, non-empty and free of unknown
+        placeholders; otherwise the current set stays in use. Returns True if
+        the templates were swapped.
+        """
+        try:
+            templates = self._read_message_variations(self.message_file)
+        except Exception as e:
+            logger.warning(f"Message file changed but could not be read ({e}); "
+                           f"keeping the current {len(self.message_templates)} variation(s).")
+            return False
+        if not templates:
+            logger.warning("Message file changed but is now empty; keeping the current variation(s).")
+            return False
+        unknown = sorted({slot for t in templates for slot in t.unknown_slots})
+        if unknown:
+            logger.warning(f"Message file changed but uses unknown placeholder(s) {', '.join(unknown)}; "
+                           f"keeping the current variation(s).")
+            return False
+        self.message_templates = templates
+        logger.info(f"Reloaded {len(templates)} message variation(s) from '{self.message_file}'.")
+        self._check_name_only_variation()
+        return True
+
+    def _check_name_only_variation(self):
+        """Warn (once per load) if every variation needs {title} or {company}.
+
+        Such a variation can't be sent to someone whose title or company is
+        unknown. Without one that needs only {name}, those people get the
+        built-in English DEFAULT_MESSAGE instead of a note from the file.
+        """
+        if self.message_templates and all(t.required_slots for t in self.message_templates):
+            logger.warning("Every message variation uses {title} or {company} outside [...]; people "
+                           "whose title or company is unknown will get the built-in note "
+                           f"\"{self.DEFAULT_MESSAGE}\". Add a variation that only uses {{name}}, "
+                           "or put the title/company words in [...] to make them optional.")
 
     @staticmethod
     def _message_length(text):
@@ -216,39 +1494,147 @@ class LinkedInAutomator:
         an emoji like 😄 counts as 2. Counting with Python's len() (code points)
         would under-count and let the message overflow to e.g. 302/300.
         """
-        return len(text.encode('utf-16-le')) // 2
+        return _utf16_length(text)
 
-    def _remove_name_placeholder(self, template):
-        """Drop the {name} placeholder along with an adjacent comma/space.
-
-        Turns "Olá, {name}!" into "Olá!" (not "Olá, !") so the greeting still
-        reads cleanly when the name is omitted.
-        """
-        return re.sub(r",?\s*\{name\}", "", template)
-
-    def personalize_message(self, name=None):
-        """Pick a random message variation and personalize it with the name.
+    def personalize_message(self, name=None, company=None, title=None):
+        """Pick a random message variation and personalize it.
 
         The bot rotates among the variations loaded from the message file so the
-        notes don't all look identical. LinkedIn caps the note at 300 characters;
-        if inserting the name pushes a variation past 300 (e.g. a long compound
-        name like "Walisson Henrique"), we omit the name for that invite so the
-        request still goes through ("Olá!" instead of "Olá, Walisson Henrique!").
+        notes don't all look identical. A variation that needs a {title} or
+        {company} this person doesn't have is skipped for another one. LinkedIn
+        caps the note at 300 characters; if the values push a variation past it
+        (e.g. a long compound name like "Walisson Henrique"), only the optional
+        parts that overflow are left out ("Olá!" instead of "Olá, Walisson
+        Henrique!"). Variations from the file are always preferred; only if
+        none of them can be used is the built-in name-only DEFAULT_MESSAGE
+        sent (warned about when the file is loaded).
         """
         if not self.message_templates:
             return ""
 
-        template = random.choice(self.message_templates)
+        values = {"name": name, "company": company, "title": title}
+        for template in random.sample(self.message_templates, len(self.message_templates)):
+            note, omitted = template.render(values)
+            if note is not None:
+                break
+        else:
+            logger.info(f"No message variation fits the known details of '{name}' "
+                        f"(title: {title}, company: {company}); using the built-in message.")
+            note, omitted = self.fallback_template.render(values)
+        if omitted:
+            logger.warning(f"Message would be over {NOTE_LIMIT} chars with {', '.join(omitted)} "
+                           f"for '{name}'. Omitting {'it' if len(omitted) == 1 else 'them'} for this invite.")
+        return note
+
+    def prerender_notes(self, candidates, names):
+        """Render the note for every candidate of a snapshot in one batch.
+
+        Called right after the page snapshot, so template selection, slot
+        filling, the 300-unit fit check and any "omitting the name" warnings
+        all happen before a modal is opened instead of while it is waiting for
+        input. names maps aria-label -> first name. Returns {aria-label: note}
+        ({} in no-message mode).
+        """
+        if not self.message_templates:
+            return {}
+        notes = {}
+        for candidate in candidates:
+            label = candidate["label"]
+            title, company = parse_headline(candidate.get("current"), candidate.get("headline"))
+            notes[label] = self.personalize_message(names.get(label), company=company, title=title)
+        return notes
+
+    def _start_invite_timing(self, label, locate_seconds=0.0):
+        """Open a timing record for the candidate about to be processed."""
+        self._finish_invite_timing()
+        self._invite_timing = {
+            "label": label,
+            "page": self._page_number,
+            "started": time.perf_counter() - locate_seconds,
+            "phases": {"locate_connect": locate_seconds},
+            "pacing": 0.0,
+        }
+
+    def _finish_invite_timing(self):
+        """Close the current candidate's timing record, if any."""
+        record, self._invite_timing = self._invite_timing, None
+        if record is None:
+            return
+        record["total"] = time.perf_counter() - record.pop("started")
+        record["overhead"] = record["total"] - record["pacing"]
+        self.invite_timings.append(record)
+        log_event("invite",
+                  page=record["page"],
+                  label=record["label"],
+                  outcome=record.get("outcome"),
+                  total_s=round(record["total"], 4),
+                  pacing_s=round(record["pacing"], 4),
+                  overhead_s=round(record["overhead"], 4),
+                  phases={k: round(v, 4) for k, v in record["phases"].items()},
+                  clicks=record.get("clicks", []))
+
+    def _note_click(self, description, strategy):
+        """Remember which _robust_click strategy worked for the current invite."""
+        if self._invite_timing is not None:
+            self._invite_timing.setdefault("clicks", []).append(
+                {"target": description, "strategy": strategy})
+
+    @contextmanager
+    def _phase(self, name):
+        """Time a step of the invite flow into the current timing record."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self._invite_timing is not None:
+                phases = self._invite_timing["phases"]
+                phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
 
-        if name:
-            personalized = template.replace("{name}", name)
-            if self._message_length(personalized) <= 300:
-                return personalized
-            logger.warning(f"Message would be {self._message_length(personalized)} chars with "
-                  f"the name '{name}' (limit 300). Omitting the name for this invite.")
+    def _pace(self, low, high):
+        """Sleep a random, human-like interval (scaled by pacing_scale).
 
-        # No name, or the name made the message exceed 300 characters
-        return self._remove_name_placeholder(template)
+        These are the deliberate anti-detection delays, as opposed to waits for
+        the UI; their time is recorded separately from bot overhead.
+        """
+        delay = random.uniform(low, high) * self.pacing_scale
+        if delay > 0:
+            time.sleep(delay)
+        if self._invite_timing is not None:
+            self._invite_timing["pacing"] += delay
+
+    def _record_outcome(self, candidate, outcome):
+        """Store a candidate's outcome in the ledger and its timing record."""
+        if self._invite_timing is not None:
+            self._invite_timing["outcome"] = outcome
+        if self.ledger is not None and candidate:
+            self.ledger.record(self._ledger_key(candidate), outcome, candidate.get("label"))
+
+    def _ledger_key(self, candidate):
+        return InvitationLedger.key_for(candidate.get("href"), candidate.get("name"))
+
+    # Scroll the element into view (only when it is not already fully visible)
+    # and return the viewport coordinates of its center, in one call. Also
+    # reports whether that point actually lands on the element: a CDP click goes
+    # to whatever is on top, so a covered element must fall back to another
+    # strategy. elementFromPoint is followed into open shadow roots, since the
+    # invite modal lives inside #interop-outlet.
+    CLICK_POINT_JS = """
+        const el = arguments[0];
+        let r = el.getBoundingClientRect();
+        if (r.top < 0 || r.left < 0 || r.bottom > innerHeight || r.right > innerWidth) {
+            el.scrollIntoView({block: 'center', inline: 'center'});
+            r = el.getBoundingClientRect();
+        }
+        if (!r.width || !r.height) return null;
+        const x = r.left + r.width / 2, y = r.top + r.height / 2;
+        let hit = document.elementFromPoint(x, y);
+        while (hit && hit.shadowRoot) {
+            const inner = hit.shadowRoot.elementFromPoint(x, y);
+            if (!inner || inner === hit) break;
+            hit = inner;
+        }
+        return {x: x, y: y, hit: !!hit && (hit === el || el.contains(hit))};
+    """
 
     def _cdp_click(self, element, description="element"):
         """Dispatch a trusted click via Chrome DevTools Protocol.
@@ -257,15 +1643,22 @@ class LinkedInAutomator:
         they go through Chrome's native input pipeline, not JavaScript. This works
         even for elements inside shadow DOM where ActionChains sometimes fails to
         compute correct coordinates.
+
+        The click point comes from one CLICK_POINT_JS call (instead of separate
+        element.location and element.size requests), and press and release are
+        sent back to back, so a click costs three round-trips.
         """
         try:
-            loc = element.location
-            sz = element.size
-            x = loc['x'] + sz['width'] / 2
-            y = loc['y'] + sz['height'] / 2
+            point = self.driver.execute_script(self.CLICK_POINT_JS, element)
+            if not point:
+                logger.debug(f"CDP click skipped on {description}: element has no box")
+                return False
+            if not point.get("hit"):
+                logger.debug(f"CDP click skipped on {description}: center is covered by another element")
+                return False
+            x, y = point["x"], point["y"]
             params = {"button": "left", "clickCount": 1, "modifiers": 0, "x": x, "y": y}
             self.driver.execute_cdp_cmd("Input.dispatchMouseEvent", {**params, "type": "mousePressed"})
-            time.sleep(0.05)
             self.driver.execute_cdp_cmd("Input.dispatchMouseEvent", {**params, "type": "mouseReleased"})
             logger.debug(f"CDP click OK on {description} at ({x:.0f},{y:.0f})")
             return True
@@ -273,25 +1666,18 @@ class LinkedInAutomator:
             logger.debug(f"CDP click failed on {description}: {type(e).__name__}: {e}")
             return False
 
-    def _robust_click(self, element, description="element"):
-        """Click an element with a TRUSTED event, retrying before any JS fallback.
-
-        LinkedIn ignores untrusted (JS) clicks for actions like Send, so we must
-        keep the click trusted. Order: native .click() -> ActionChains -> CDP
-        (all three trusted) -> JS click only as a last resort (logged as a
-        warning, since it may be ignored). Returns True if some click was
-        dispatched.
-        """
-        # 1) Native click (trusted)
+    def _native_click(self, element, description="element"):
+        """Plain WebElement.click() (trusted)."""
         try:
             element.click()
             logger.debug(f"Native click OK on {description}")
             return True
         except Exception as e:
-            logger.debug(f"Native click failed on {description} "
-                         f"({type(e).__name__}: {e}); trying ActionChains")
+            logger.debug(f"Native click failed on {description} ({type(e).__name__}: {e})")
+            return False
 
-        # 2) ActionChains click (trusted real mouse event via OS)
+    def _actionchains_click(self, element, description="element"):
+        """ActionChains click (trusted real mouse event via OS)."""
         try:
             try:
                 self.driver.execute_script(
@@ -302,22 +1688,46 @@ class LinkedInAutomator:
             logger.debug(f"ActionChains click OK on {description}")
             return True
         except Exception as e:
-            logger.debug(f"ActionChains failed on {description} "
-                         f"({type(e).__name__}: {e}); trying CDP click")
+            logger.debug(f"ActionChains failed on {description} ({type(e).__name__}: {e})")
+            return False
 
-        # 3) CDP click (trusted via Chrome DevTools Protocol; bypasses shadow DOM
-        #    coordinate issues that can trip up ActionChains)
-        if self._cdp_click(element, description):
-            return True
+    def _robust_click(self, element, description="element"):
+        """Click an element with a TRUSTED event, retrying before any JS fallback.
 
-        # 4) Last resort: untrusted JS click
+        LinkedIn ignores untrusted (JS) clicks for actions like Send, so we must
+        keep the click trusted. The trusted strategies are native .click(),
+        ActionChains and CDP (which bypasses the shadow DOM coordinate issues
+        that can trip up ActionChains). By default they run in that order, but
+        the strategy that last worked for this kind of target goes first (see
+        ClickStrategyStats), so a consistently intercepted native click stops
+        costing an exception per invite. A JS click is only the last resort
+        (logged as a warning, since it may be ignored). Returns True if some
+        click was dispatched.
+        """
+        strategies = {
+            "native": self._native_click,
+            "actionchains": self._actionchains_click,
+            "cdp": self._cdp_click,
+        }
+        for name in self.click_stats.order(description):
+            ok = strategies[name](element, description)
+            self.click_stats.record(description, name, ok)
+            if ok:
+                self._note_click(description, name)
+                return True
+
+        # Last resort: untrusted JS click
         logger.warning(f"All trusted clicks failed on {description}; "
                        f"falling back to JS click - LinkedIn may ignore it")
         try:
             self.driver.execute_script("arguments[0].click();", element)
+            self.click_stats.record(description, "js", True)
+            self._note_click(description, "js")
             return True
         except Exception as e2:
             logger.warning(f"All click methods failed on {description}: {e2}")
+            self.click_stats.record(description, "js", False)
+            self._note_click(description, None)
             return False
 
     def fill_message_box(self, message_box, text):
@@ -329,7 +1739,9 @@ class LinkedInAutomator:
         ChromeDriver's send_keys cannot handle non-BMP characters (e.g. emoji),
         so when the text contains any, we type the BMP part to activate the
         binding and then inject the full text (with emoji) via the textarea's
-        native value setter plus an input event.
+        native value setter plus an input event. In the default "insert" mode
+        most of the note goes in with one CDP command instead (see
+        _insert_note_text); the typing path remains the fallback.
         """
         # Focus the field with a real click so the framework treats it as user input
         try:
@@ -339,6 +1751,9 @@ class LinkedInAutomator:
 
         message_box.clear()
 
+        if self.note_input == "insert" and self._insert_note_text(message_box, text):
+            return
+
         bmp_text = ''.join(ch for ch in text if ord(ch) <= 0xFFFF)
 
         if bmp_text == text:
@@ -359,6 +1774,375 @@ class LinkedInAutomator:
             "el.dispatchEvent(new Event('change', { bubbles: true }));",
             message_box, text)
 
+    # Characters typed as real keystrokes after the Input.insertText bulk insert
+    NOTE_TYPED_TAIL = 4
+
+    def _insert_note_text(self, message_box, text):
+        """Enter the note with one CDP Input.insertText plus a few keystrokes.
+
+        send_keys sends one key event per character, so a 300-character note
+        takes a while. Input.insertText inserts the text into the focused
+        textarea the way an IME commit does (trusted input events, any Unicode
+        including emoji) in a single command. The last NOTE_TYPED_TAIL
+        characters are still typed with send_keys, so the framework binding
+        sees real key events and enables Send. If the note ends in an emoji
+        (which send_keys can't type), everything is inserted and a space +
+        backspace does that job instead. Returns False if CDP isn't available,
+        so the caller falls back to typing.
+        """
+        tail_length = 0
+        while (tail_length < min(self.NOTE_TYPED_TAIL, len(text))
+               and ord(text[-1 - tail_length]) <= 0xFFFF):
+            tail_length += 1
+        head, tail = text[:len(text) - tail_length], text[len(text) - tail_length:]
+        try:
+            if head:
+                self.driver.execute_cdp_cmd("Input.insertText", {"text": head})
+        except Exception as e:
+            logger.debug(f"Input.insertText unavailable ({type(e).__name__}: {e}); typing the note")
+            message_box.clear()
+            return False
+        message_box.send_keys(tail if tail else Keys.SPACE + Keys.BACKSPACE)
+        return True
+
+    # One-round-trip snapshot of the invite modal. Walks the #interop-outlet
+    # shadow host(s) inside the page and reports everything the invite flow
+    # needs: whether the modal is open, the shadow root itself, whether it is the
+    # email-verification screen, every visible button keyed by aria-label (with
+    # its element and enabled flag) and the note textarea.
+    MODAL_STATE_JS = """
+        const MODAL = "[data-test-modal-id='send-invite-modal'], [data-test-modal] [id='send-invite-modal']";
+        const EMAIL = "input[type='email'], input[name='email'], [data-test-send-invite-modal-check-email-link]";
+        const visible = el => el.getClientRects().length > 0;
+        const state = {present: false, root: null, email: false, buttons: {}, textarea: null};
+        for (const host of document.querySelectorAll("#interop-outlet, [data-testid='interop-shadowdom']")) {
+            const root = host.shadowRoot;
+            if (!root || !root.querySelector(MODAL)) continue;
+            const scope = root.querySelector("[data-test-modal-id='send-invite-modal']") || root;
+            state.present = true;
+            state.root = root;
+            state.email = !!scope.querySelector(EMAIL);
+            for (const btn of scope.querySelectorAll("button[aria-label]")) {
+                const label = btn.getAttribute("aria-label");
+                if (label in state.buttons || !visible(btn)) continue;
+                state.buttons[label] = {
+                    element: btn,
+                    enabled: !btn.disabled && btn.getAttribute("aria-disabled") !== "true"};
+            }
+            const box = scope.querySelector("#custom-message");
+            state.textarea = box && visible(box) ? box : null;
+            break;
+        }
+        return state;
+    """
+
+    # Each poll is now a single WebDriver call, so we can afford to poll faster
+    MODAL_POLL_INTERVAL = 0.1
+
+    def probe_modal_state(self):
+        """Return the invite modal's whole state in a single WebDriver call.
+
+        The dict has: present (bool), root (the #interop-outlet ShadowRoot or
+        None), email (email-verification screen shown), buttons ({aria-label:
+        {"element", "enabled"}} for visible buttons) and textarea (the note box
+        or None). Replaces the find host -> .shadow_root -> find_elements ->
+        is_displayed/is_enabled chains, each of which cost an HTTP round-trip.
+        """
+        try:
+            state = self.driver.execute_script(self.MODAL_STATE_JS)
+            if isinstance(state, dict):
+                return state
+        except Exception as e:
+            logger.debug(f"Modal state probe failed: {type(e).__name__}: {e}")
+        return {"present": False, "root": None, "email": False, "buttons": {}, "textarea": None}
+
+    # Event-driven replacement for the fixed "let the UI settle" sleeps. Run via
+    # execute_async_script: resolves "ready" as soon as a MutationObserver on the
+    # document and on every #interop-outlet shadow root sees the condition hold,
+    # "limit" if the invitation-limit dialog shows up first, or "timeout".
+    # Arguments: condition name, timeout (ms), then condition-specific args.
+    UI_WAIT_JS = """
+        const args = Array.from(arguments);
+        const done = args.pop();
+        const [condition, timeoutMs, ...params] = args;
+        const HOSTS = "#interop-outlet, [data-testid='interop-shadowdom']";
+        const roots = () => Array.from(document.querySelectorAll(HOSTS))
+            .map(h => h.shadowRoot).filter(Boolean);
+        const modal = () => {
+            for (const r of roots()) {
+                const m = r.querySelector("[data-test-modal-id='send-invite-modal']");
+                if (m) return m;
+            }
+            return null;
+        };
+        const limitShown = () =>
+            !!document.querySelector(".ip-fuse-limit-alert, #ip-fuse-limit-alert__header");
+        const checks = {
+            modal_ready: () => {
+                const m = modal();
+                return !!m && !!m.querySelector(
+                    "button[aria-label='Add a note'], button[aria-label='Send without a note'], " +
+                    "input[type='email'], input[name='email']");
+            },
+            send_enabled: () => {
+                const m = modal();
+                const b = m && m.querySelector("button[aria-label='Send invitation']");
+                return !!b && !b.disabled && b.getAttribute("aria-disabled") !== "true";
+            },
+            invite_registered: () => {
+                const [label, name] = params;
+                if (name) {
+                    for (const el of document.querySelectorAll(
+                            "a[aria-label*='Pending'], button[aria-label*='Pending']")) {
+                        if (el.getAttribute("aria-label").includes(name)) return true;
+                    }
+                }
+                for (const a of document.querySelectorAll("a[aria-label]")) {
+                    if (a.getAttribute("aria-label") === label) return false;
+                }
+                return true;
+            },
+        };
+        const check = checks[condition];
+        if (!check) { done("error"); return; }
+
+        let finished = false;
+        const observers = [];
+        const observed = new Set();
+        const finish = result => {
+            if (finished) return;
+            finished = true;
+            observers.forEach(o => o.disconnect());
+            clearTimeout(timer);
+            clearInterval(rescan);
+            done(result);
+        };
+        const evaluate = () => {
+            if (limitShown()) finish("limit");
+            else if (check()) finish("ready");
+        };
+        const observeAll = () => {
+            for (const target of [document, ...roots()]) {
+                if (observed.has(target)) continue;
+                observed.add(target);
+                const o = new MutationObserver(evaluate);
+                o.observe(target, {childList: true, subtree: true, attributes: true, characterData: true});
+                observers.push(o);
+            }
+        };
+        const timer = setTimeout(() => finish("timeout"), timeoutMs);
+        // Shadow roots attached after we start aren't covered by the document
+        // observer, so pick them up with a slow rescan.
+        const rescan = setInterval(() => { observeAll(); evaluate(); }, 250);
+        observeAll();
+        evaluate();
+    """
+
+    def wait_for_ui(self, condition, timeout, *params):
+        """Wait (at most timeout seconds) for a UI condition, event-driven.
+
+        Conditions: "modal_ready" (invite modal rendered its buttons or the email
+        screen), "send_enabled" (Send invitation button enabled) and
+        "invite_registered" (params: aria-label, full name; the Connect control
+        is gone or a matching Pending control appeared). Returns "ready",
+        "limit" (limit dialog appeared) or "timeout". If the async script can't
+        run we fall back to sleeping the full timeout, as before.
+        """
+        try:
+            return self.driver.execute_async_script(
+                self.UI_WAIT_JS, condition, int(timeout * 1000), *params)
+        except Exception as e:
+            logger.debug(f"UI wait '{condition}' failed ({type(e).__name__}: {e}); "
+                         f"sleeping {timeout}s instead")
+            time.sleep(timeout)
+            return "timeout"
+
+    # Everything that follows a Send, awaited at once in one async script:
+    # whether the invite modal has closed, whether the row registered the
+    # invite (Connect control gone or a matching Pending control), the HTTP
+    # status of the invite request and whether the limit dialog appeared. The
+    # status comes from a PerformanceObserver on resource entries
+    # (responseStatus), so the browser pushes it the moment the response is
+    # in. Resolves as soon as the outcome is decided: a 429 or the limit
+    # dialog at once, otherwise when the modal is closed, the row is updated
+    # and the status is known (or statusGraceMs after that without a status),
+    # or registerMs after the modal closed without the row updating (the
+    # ignored-click case). Arguments: aria-label, full name, endpoint URL
+    # fragments, ms elapsed since the Send click, timeout (ms), statusGraceMs,
+    # registerMs.
+    SEND_OUTCOME_JS = """
+        const done = arguments[arguments.length - 1];
+        const [label, name, fragments, sinceMs, timeoutMs, statusGraceMs, registerMs] = arguments;
+        const HOSTS = "#interop-outlet, [data-testid='interop-shadowdom']";
+        const since = performance.now() - sinceMs;
+        const result = {modal_closed: false, registered: false, pending: false,
+                        status: null, status_url: null, limit: false, timed_out: false};
+        const modalOpen = () => Array.from(document.querySelectorAll(HOSTS))
+            .some(h => h.shadowRoot &&
+                       h.shadowRoot.querySelector("[data-test-modal-id='send-invite-modal']"));
+        const registered = () => {
+            if (name) {
+                for (const el of document.querySelectorAll(
+                        "a[aria-label*='Pending'], button[aria-label*='Pending']")) {
+                    if (el.getAttribute("aria-label").includes(name)) {
+                        result.pending = true;
+                        return true;
+                    }
+                }
+            }
+            for (const a of document.querySelectorAll("a[aria-label]")) {
+                if (a.getAttribute("aria-label") === label) return false;
+            }
+            return true;
+        };
+        const onEntries = entries => {
+            for (const e of entries) {
+                if (e.startTime >= since && e.responseStatus &&
+                        fragments.some(f => e.name.includes(f))) {
+                    result.status = e.responseStatus;
+                    result.status_url = e.name;
+                }
+            }
+            evaluate();
+        };
+
+        let finished = false, settledAt = null, closedAt = null;
+        const finish = timedOut => {
+            if (finished) return;
+            finished = true;
+            result.timed_out = timedOut;
+            observer.disconnect();
+            network.disconnect();
+            clearTimeout(timer);
+            clearInterval(tick);
+            done(result);
+        };
+        const evaluate = () => {
+            if (finished) return;
+            result.limit = !!document.querySelector(
+                ".ip-fuse-limit-alert, #ip-fuse-limit-alert__header");
+            result.modal_closed = !modalOpen();
+            result.registered = result.modal_closed && registered();
+            if (result.limit || result.status === 429) { finish(false); return; }
+            if (result.modal_closed && closedAt === null) closedAt = performance.now();
+            if (result.modal_closed && result.registered) {
+                if (result.status !== null) { finish(false); return; }
+                if (settledAt === null) settledAt = performance.now();
+                else if (performance.now() - settledAt >= statusGraceMs) finish(false);
+            } else if (closedAt !== null && performance.now() - closedAt >= registerMs) {
+                finish(false);
+            }
+        };
+        const observer = new MutationObserver(evaluate);
+        observer.observe(document, {childList: true, subtree: true, attributes: true});
+        const network = new PerformanceObserver(list => onEntries(list.getEntries()));
+        network.observe({type: "resource", buffered: true});
+        // The modal lives in a shadow root the document observer can't see into
+        const tick = setInterval(evaluate, 100);
+        const timer = setTimeout(() => finish(true), timeoutMs);
+        onEntries(performance.getEntriesByType("resource"));
+    """
+
+    def wait_send_outcome(self, target_label, full_name, timeout=7, status_grace=0.5, register_wait=2):
+        """Wait for everything a Send leads to in one event-driven round trip.
+
+        Replaces waiting for the modal to close, then for the invite response,
+        then for the row to turn Pending, one after the other: the browser
+        watches all three at once (see SEND_OUTCOME_JS) and answers when the
+        outcome is decided. Returns a dict with modal_closed, registered,
+        pending, status (HTTP status of the invite request, None if it wasn't
+        seen), status_url, limit and timed_out, or None if the script could
+        not run. Once the modal has closed, the row gets register_wait seconds
+        to turn Pending, like the step-by-step verification.
+        """
+        since_ms = (time.perf_counter() - self._send_clicked_at) * 1000 + 50
+        try:
+            return self.driver.execute_async_script(
+                self.SEND_OUTCOME_JS, target_label or "", full_name or "",
+                list(INVITE_ENDPOINT_FRAGMENTS), since_ms, int(timeout * 1000),
+                int(status_grace * 1000), int(register_wait * 1000))
+        except Exception as e:
+            logger.debug(f"Send outcome wait failed ({type(e).__name__}: {e}); "
+                         f"checking step by step")
+            return None
+
+    def _mark_send(self):
+        """Note that Send is about to be clicked (scopes the response checks)."""
+        if self.perf_consumer is not None:
+            self.perf_consumer.clear()  # only this invite's response counts
+        self._send_clicked_at = time.perf_counter()
+
+    def _log_rate_limited(self, url):
+        logger.error(
+            "HTTP 429 (Too Many Requests) from LinkedIn's invitation "
+            f"endpoint:\n    {url}\n"
+            "Your invite quota is exhausted - stopping automation so "
+            "you don't keep hammering the rate limit.")
+
+    def await_send_result(self, shadow, target_label, full_name):
+        """What became of the invite whose Send was just clicked.
+
+        Returns "sent", "failed" (didn't register), "modal-stuck" (the modal
+        never closed), "rate-limited" (the invite request answered HTTP 429)
+        or "limit-stop" (the limit dialog appeared and the run must stop; the
+        dialog has already been handled, so the caller must not check again).
+        Uses the combined wait_send_outcome(); if the status of the request
+        wasn't visible to the page it falls back to the performance-log 429
+        check, and if the combined wait can't run at all, to the separate
+        modal / 429 / Pending checks.
+        """
+        with self._phase("wait_send_outcome"):
+            outcome = self.wait_send_outcome(target_label, full_name)
+        if outcome is None:
+            return self._await_send_result_stepwise(shadow, target_label, full_name)
+
+        if outcome["status"] == 429:
+            self._log_rate_limited(outcome["status_url"])
+            return "rate-limited"
+        if not outcome["modal_closed"]:
+            return "modal-stuck"
+        if outcome["status"] is None:
+            with self._phase("detect_rate_limit_429"):
+                if self.detect_rate_limit_429(wait=0.5):
+                    return "rate-limited"
+        if outcome["limit"]:
+            if not self.check_invitation_limit_warning():
+                return "limit-stop"
+            if not outcome["registered"]:
+                # The wait ended when the dialog appeared, before the row had
+                # a chance to turn Pending: check again now it's dismissed
+                with self._phase("verify_invitation"):
+                    verified = self.verify_successful_invitation_sent(target_label, full_name)
+                return "sent" if verified else "failed"
+        if outcome["registered"]:
+            logger.debug(f"Invite to {target_label} registered "
+                         f"({'Pending shown' if outcome['pending'] else 'Connect control gone'}, "
+                         f"HTTP {outcome['status'] or '?'})")
+            return "sent"
+        logger.warning(f"Connect control still present for {target_label} - "
+                       f"invite did NOT register (likely an ignored click)")
+        return "failed"
+
+    def _await_send_result_stepwise(self, shadow, target_label, full_name):
+        """await_send_result() with one wait after another (the fallback)."""
+        # Wait for the modal to close (it leaves the shadow root when sent)
+        with self._phase("wait_modal_closed"):
+            modal_closed = self.wait_modal_closed(shadow, timeout=5)
+        if not modal_closed:
+            return "modal-stuck"
+
+        # Network-level rate-limit guard: if the Send POST came back 429,
+        # we're out of quota - stop now even if the UI showed no dialog.
+        with self._phase("detect_rate_limit_429"):
+            rate_limited = self.detect_rate_limit_429()
+        if rate_limited:
+            return "rate-limited"
+
+        # Verify the invitation actually registered (person turned Pending)
+        with self._phase("verify_invitation"):
+            verified = self.verify_successful_invitation_sent(target_label, full_name)
+        return "sent" if verified else "failed"
+
     def get_modal_shadow_root(self, timeout=10):
         """Return the #interop-outlet shadow root once the invite modal is inside it.
 
@@ -370,22 +2154,10 @@ class LinkedInAutomator:
         """
         end = time.time() + timeout
         while time.time() < end:
-            for host_sel in ("#interop-outlet", "[data-testid='interop-shadowdom']"):
-                hosts = self.driver.find_elements(By.CSS_SELECTOR, host_sel)
-                for host in hosts:
-                    try:
-                        sr = host.shadow_root
-                    except Exception:
-                        continue
-                    try:
-                        if sr.find_elements(
-                                By.CSS_SELECTOR,
-                                "[data-test-modal-id='send-invite-modal'], "
-                                "[data-test-modal] [id='send-invite-modal']"):
-                            return sr
-                    except Exception:
-                        continue
-            time.sleep(0.3)
+            state = self.probe_modal_state()
+            if state["present"] and state["root"] is not None:
+                return state["root"]
+            time.sleep(self.MODAL_POLL_INTERVAL)
         return None
 
     def find_in_shadow(self, shadow_root, css, timeout=10, require_enabled=False):
@@ -393,20 +2165,27 @@ class LinkedInAutomator:
 
         ShadowRoot only supports CSS selectors (not XPath). When require_enabled is
         True we wait until the element is also enabled (e.g. the Send button, which
-        stays disabled until the note text is registered). Returns None on timeout.
+        stays disabled until the note text is registered). Visibility and enabled
+        state are checked in the page, so each poll is one round-trip. Returns None
+        on timeout.
         """
         end = time.time() + timeout
         while time.time() < end:
             try:
-                for el in shadow_root.find_elements(By.CSS_SELECTOR, css):
-                    try:
-                        if el.is_displayed() and (not require_enabled or el.is_enabled()):
-                            return el
-                    except Exception:
-                        continue
+                el = self.driver.execute_script(
+                    "const [root, css, needEnabled] = arguments;"
+                    "for (const el of root.querySelectorAll(css)) {"
+                    "  if (!el.getClientRects().length) continue;"
+                    "  if (needEnabled && (el.disabled || el.getAttribute('aria-disabled') === 'true')) continue;"
+                    "  return el;"
+                    "}"
+                    "return null;",
+                    shadow_root, css, require_enabled)
+                if el is not None:
+                    return el
             except Exception:
                 pass
-            time.sleep(0.3)
+            time.sleep(self.MODAL_POLL_INTERVAL)
         return None
 
     def wait_modal_closed(self, shadow_root, timeout=5):
@@ -414,12 +2193,13 @@ class LinkedInAutomator:
         end = time.time() + timeout
         while time.time() < end:
             try:
-                if not shadow_root.find_elements(
-                        By.CSS_SELECTOR, "[data-test-modal-id='send-invite-modal']"):
+                if not self.driver.execute_script(
+                        "return !!arguments[0].querySelector("
+                        "\"[data-test-modal-id='send-invite-modal']\");", shadow_root):
                     return True
             except Exception:
                 return True  # shadow/host gone => modal closed
-            time.sleep(0.3)
+            time.sleep(self.MODAL_POLL_INTERVAL)
         return False
 
     def modal_requires_email(self, shadow_root):
@@ -427,79 +2207,106 @@ class LinkedInAutomator:
 
         Some members can only be invited if you supply their email address. That
         screen replaces the normal note/Send flow with an email input. We can't
-        provide the email, so the caller cancels and moves on.
+        provide the email, so the caller cancels and moves on. The state probe
+        finds the modal's shadow root on its own, so shadow_root is not queried.
         """
-        try:
-            return bool(shadow_root.find_elements(
-                By.CSS_SELECTOR,
-                "input[type='email'], input[name='email'], "
-                "[data-test-send-invite-modal-check-email-link]"))
-        except Exception:
-            return False
+        return bool(self.probe_modal_state()["email"])
 
     def dismiss_open_modal(self):
         """Best-effort close of any open invite modal (shadow DOM first, then light)."""
         try:
-            for host_sel in ("#interop-outlet", "[data-testid='interop-shadowdom']"):
-                for host in self.driver.find_elements(By.CSS_SELECTOR, host_sel):
-                    try:
-                        sr = host.shadow_root
-                    except Exception:
-                        continue
-                    btns = sr.find_elements(By.CSS_SELECTOR, "button[aria-label='Dismiss']")
-                    if btns:
-                        self._robust_click(btns[0])
-                        return
+            dismiss = self.probe_modal_state()["buttons"].get("Dismiss")
+            if dismiss:
+                self._robust_click(dismiss["element"], "Dismiss button")
+                return
         except Exception:
             pass
         try:
-            btns = self.driver.find_elements(By.XPATH, "//button[contains(@aria-label, 'Dismiss')]")
-            if btns:
-                self.driver.execute_script("arguments[0].click();", btns[0])
+            btn = self.selectors.find("dismiss_button")
+            if btn:
+                self.driver.execute_script("arguments[0].click();", btn)
         except Exception:
             pass
 
+    # Installs (once per page load) a MutationObserver that raises a flag when
+    # the invitation-limit dialog appears: an ip-fuse-limit-alert element, or an
+    # <h2> mentioning the weekly invitation limit. Only added nodes are looked
+    # at, so the observer costs next to nothing between dialogs. Returns the
+    # flag. Argument: reset (clear the flag, then re-scan the current DOM).
+    LIMIT_WATCH_JS = """
+        const reset = arguments[0];
+        const ALERT = ".ip-fuse-limit-alert, #ip-fuse-limit-alert__header";
+        const isLimitHeading = h => /weekly invitation limit/i.test(h.textContent || "");
+        const scan = node => {
+            if (node.nodeType === Node.TEXT_NODE) node = node.parentElement;
+            if (!node || node.nodeType !== Node.ELEMENT_NODE) return false;
+            if (node.matches(ALERT) || node.querySelector(ALERT)) return true;
+            if (node.tagName === "H2") return isLimitHeading(node);
+            return Array.from(node.getElementsByTagName("h2")).some(isLimitHeading);
+        };
+        let watch = window.__linkedinBotLimitWatch;
+        if (!watch) {
+            watch = window.__linkedinBotLimitWatch = {flag: false};
+            watch.observer = new MutationObserver(mutations => {
+                if (watch.flag) return;
+                for (const m of mutations) {
+                    for (const node of m.addedNodes) {
+                        if (scan(node)) { watch.flag = true; return; }
+                    }
+                }
+            });
+            watch.observer.observe(document, {childList: true, subtree: true});
+            watch.flag = scan(document.documentElement);
+        } else if (reset) {
+            watch.flag = scan(document.documentElement);
+        }
+        return watch.flag;
+    """
+
+    def limit_alert_flagged(self, reset=False):
+        """Cheap check (one small script call) for a possible limit dialog.
+
+        Reads the flag raised by the LIMIT_WATCH_JS observer, installing the
+        observer first if this page doesn't have it yet. If the check itself
+        fails, returns True so the caller falls back to the full check.
+        """
+        try:
+            return bool(self.driver.execute_script(self.LIMIT_WATCH_JS, reset))
+        except Exception as e:
+            logger.debug(f"Limit watcher unavailable: {type(e).__name__}: {e}")
+            return True
+
     def check_invitation_limit_warning(self):
-        """Check if the invitation limit warning is displayed and ask user what to do."""
+        """Check if the invitation limit warning is displayed and ask user what to do.
+
+        The full XPath checks only run when the limit watcher has flagged a
+        dialog. Otherwise this is a single cheap script call, which matters
+        because it runs several times per invite.
+        """
         try:
+            if not self.limit_alert_flagged():
+                return True
+
             # First check for the HARD LIMIT reached dialog - always stop for this
-            hard_limit_elements = self.driver.find_elements(
-                By.XPATH,
-                "//h2[contains(text(), 'reached the weekly invitation limit')] | " +
-                "//h2[@id='ip-fuse-limit-alert__header' and contains(text(), 'reached the weekly')] | " +
-                "//div[contains(@class, 'ip-fuse-limit-alert')]//h2[contains(text(), 'reached')]"
-            )
+            hard_limit_elements = self.selectors.find_all("limit_reached")
 
             if hard_limit_elements:
                 logger.error("You've reached the weekly invitation limit! Stopping automation.")
 
-                # Click the "Got it" button to dismiss the warning
+                # Click the "Got it" button to dismiss the warning, or the
+                # dialog's Dismiss button if "Got it" can't be found
                 try:
-                    got_it_button = self.driver.find_element(
-                        By.XPATH,
-                        "//button[.//span[text()='Got it']] | " +
-                        "//button[contains(@class, 'ip-fuse-limit-alert__primary-action')]"
-                    )
-                    self.driver.execute_script("arguments[0].click();", got_it_button)
+                    button = (self.selectors.find("limit_got_it", thorough=True)
+                              or self.selectors.find("dismiss_button", thorough=True))
+                    if button:
+                        self.driver.execute_script("arguments[0].click();", button)
                 except:
-                    # Try to dismiss the dialog if the "Got it" button can't be found
-                    try:
-                        dismiss_button = self.driver.find_element(
-                            By.XPATH,
-                            "//button[@aria-label='Dismiss']"
-                        )
-                        self.driver.execute_script("arguments[0].click();", dismiss_button)
-                    except:
-                        pass
+                    pass
 
                 return False  # Always stop when hard limit is reached
 
             # Then check for the "close to" warning
-            warning_elements = self.driver.find_elements(
-                By.XPATH,
-                "//h2[contains(text(), 'close to the weekly invitation limit')] | " +
-                "//div[contains(@class, 'ip-fuse-limit-alert')]//h2[contains(text(), 'close to')]"
-            )
+            warning_elements = self.selectors.find_all("limit_close")
 
             if warning_elements:
                 logger.warning("You're close to the weekly invitation limit!")
@@ -507,13 +2314,11 @@ class LinkedInAutomator:
                 if self.auto_continue:
                     logger.info("Auto-continue enabled (-y flag). Automatically continuing past the warning.")
                     # Click the "Got it" button to dismiss the warning
-                    got_it_button = self.driver.find_element(
-                        By.XPATH,
-                        "//button[.//span[text()='Got it']] | " +
-                        "//button[contains(@class, 'ip-fuse-limit-alert__primary-action')]"
-                    )
-                    self.driver.execute_script("arguments[0].click();", got_it_button)
+                    got_it_button = self.selectors.find("limit_got_it", thorough=True)
+                    if got_it_button:
+                        self.driver.execute_script("arguments[0].click();", got_it_button)
                     time.sleep(1)
+                    self.limit_alert_flagged(reset=True)
                     return True
                 else:
                     # Ask the user what they want to do
@@ -523,47 +2328,23 @@ class LinkedInAutomator:
                     if user_decision in ["yes", "y"]:
                         logger.info("Continuing automation until all invites are used.")
                         # Click the "Got it" button to dismiss the warning
-                        got_it_button = self.driver.find_element(
-                            By.XPATH,
-                            "//button[.//span[text()='Got it']] | " +
-                            "//button[contains(@class, 'ip-fuse-limit-alert__primary-action')]"
-                        )
-                        self.driver.execute_script("arguments[0].click();", got_it_button)
+                        got_it_button = self.selectors.find("limit_got_it", thorough=True)
+                        if got_it_button:
+                            self.driver.execute_script("arguments[0].click();", got_it_button)
                         time.sleep(1)
+                        self.limit_alert_flagged(reset=True)
                         return True
                     else:
                         logger.info("Stopping automation to save some invites for manual use.")
                         return False
 
+            # False alarm (or the dialog is already gone): re-arm the watcher
+            self.limit_alert_flagged(reset=True)
             return True  # No warning found, continue
         except Exception as e:
             logger.error(f"Error checking invitation limit: {str(e)}")
             return True  # Continue if there was an error checking
 
-    def _drain_performance_logs(self):
-        """Return newly buffered performance-log messages as parsed dicts.
-
-        Chrome's performance log delivers each network event as a JSON string in
-        entry['message']; we unwrap the nested {'message': {...}} envelope.
-        get_log() also CLEARS the buffer, so each call returns only events since
-        the previous call. Returns [] when performance logging is unavailable.
-        """
-        if not getattr(self, "perf_logging", False):
-            return []
-        try:
-            raw = self.driver.get_log("performance")
-        except Exception as e:
-            logger.debug(f"Could not read performance log: {type(e).__name__}: {e}")
-            return []
-
-        messages = []
-        for entry in raw:
-            try:
-                messages.append(json.loads(entry["message"])["message"])
-            except Exception:
-                continue
-        return messages
-
     def _log_quota_from_invite_response(self, request_id, headers):
         """Log any genuine rate-limit headers from a successful invite response.
 
@@ -583,38 +2364,30 @@ class LinkedInAutomator:
 
         LinkedIn's voyagerRelationshipsDashMemberRelationships endpoint answers
         429 (Too Many Requests) once your invitation quota is spent - even when
-        no "limit reached" dialog appears. Because the response arrives a moment
-        after the Send click, we poll the performance log for up to `wait`
-        seconds. Returns True (and logs an error) if such a 429 is seen.
-        On successful responses we also peek at headers/body for quota info.
+        no "limit reached" dialog appears. The background PerformanceLogConsumer
+        queues every invite-endpoint response, so this returns as soon as the
+        Send response is known (usually instantly) and only waits up to `wait`
+        seconds if it hasn't arrived yet. Returns True (and logs an error) if
+        it is a 429. On successful responses we also peek at headers for quota
+        info.
         """
-        if not getattr(self, "perf_logging", False):
+        if self.perf_consumer is None:
             return False
 
         end = time.time() + wait
         while True:
-            for msg in self._drain_performance_logs():
-                if msg.get("method") != "Network.responseReceived":
-                    continue
-                params = msg.get("params", {})
-                response = params.get("response", {})
-                url = response.get("url", "")
-                if not any(frag in url for frag in INVITE_ENDPOINT_FRAGMENTS):
-                    continue
-                status = response.get("status")
-                if status == 429:
-                    logger.error(
-                        "HTTP 429 (Too Many Requests) from LinkedIn's invitation "
-                        f"endpoint:\n    {url}\n"
-                        "Your invite quota is exhausted - stopping automation so "
-                        "you don't keep hammering the rate limit.")
-                    return True
-                if status in (200, 201):
-                    self._log_quota_from_invite_response(
-                        params.get("requestId"), response.get("headers", {}))
-            if time.time() >= end:
+            try:
+                event = self.perf_consumer.responses.get(timeout=max(0.0, end - time.time()))
+            except queue.Empty:
                 return False
-            time.sleep(0.5)
+            status = event["status"]
+            if status == 429:
+                self._log_rate_limited(event["url"])
+                return True
+            if status in (200, 201):
+                self._log_quota_from_invite_response(event["request_id"], event["headers"])
+                return False
+            # Any other status (e.g. a preflight): keep waiting for the real answer
 
     def verify_successful_invitation_sent(self, target_label=None, full_name=None):
         """Confirm the invite actually registered by checking the person's state.
@@ -626,8 +2399,9 @@ class LinkedInAutomator:
         untrusted click closes the modal without sending).
         """
         try:
-            # Give the search row a moment to reflect the new state
-            time.sleep(2)
+            # Give the search row a moment to reflect the new state (returns as
+            # soon as it does; 2 s is only the upper bound)
+            self.wait_for_ui("invite_registered", 2, target_label or "", full_name or "")
 
             # A limit dialog means the send was blocked
             if not self.check_invitation_limit_warning():
@@ -638,9 +2412,7 @@ class LinkedInAutomator:
 
             # Positive signal: a "Pending" control mentioning this person
             if full_name:
-                pending = self.driver.find_elements(
-                    By.XPATH, "//a[contains(@aria-label, 'Pending')] | "
-                              "//button[contains(@aria-label, 'Pending')]")
+                pending = self.selectors.find_all("pending_control")
                 for el in pending:
                     label = el.get_attribute("aria-label") or ""
                     if full_name in label:
@@ -675,33 +2447,8 @@ class LinkedInAutomator:
         return "concat(" + ", '\"', ".join(f'"{p}"' for p in parts) + ")"
 
     def display_first_name(self, full_name):
-        """Return the name to use in the {name} placeholder.
-
-        Usually just the first token, but keeps compound first names ("João
-        Victor", "Ana Júlia", "Maria de Lourdes"): the extra token is included
-        only when it is itself a known given name, so surnames (Silva, Santos)
-        are dropped.
-        """
-        if not full_name:
-            return ""
-        tokens = full_name.split()
-        if not tokens:
-            return ""
-        first = tokens[0]
-        if len(tokens) == 1:
-            return first
-
-        # "Maria de Lourdes" -> keep connector + following given name
-        if _normalize_name_token(tokens[1]) in NAME_CONNECTORS and len(tokens) >= 3:
-            if _normalize_name_token(tokens[2]) in COMPOUND_GIVEN_NAMES:
-                return f"{first} {tokens[1]} {tokens[2]}"
-            return first
-
-        # "João Victor" -> keep second token only if it's a given name
-        if _normalize_name_token(tokens[1]) in COMPOUND_GIVEN_NAMES:
-            return f"{first} {tokens[1]}"
-
-        return first
+        """Return the name to use in the {name} placeholder (see resolve_first_name)."""
+        return resolve_first_name(full_name)
 
     def extract_name_from_aria_label(self, aria_label):
         """Extract the first name from a Connect control's aria-label.
@@ -710,14 +2457,11 @@ class LinkedInAutomator:
         aria-label reads 'Invite <Full Name> to connect'. This is the most
         reliable name source available before opening the modal.
         """
-        if not aria_label:
-            return None
-        match = re.match(r"Invite\s+(.+?)\s+to connect", aria_label, re.IGNORECASE)
-        if match:
-            full_name = match.group(1).strip()
-            if full_name:
-                return self.display_first_name(full_name)
-        return None
+        return first_name_from_aria_label(aria_label)
+
+    def extract_names_from_aria_labels(self, aria_labels):
+        """Resolve a whole page of Connect aria-labels at once ({label: name})."""
+        return first_names_from_aria_labels(aria_labels)
 
     def extract_name_from_profile(self, connect_button):
         """Extract name using the specific link structure provided."""
@@ -770,10 +2514,7 @@ class LinkedInAutomator:
 
             # If we get here, we couldn't find the name in this specific structure
             # Let's try a more general approach
-            all_name_links = self.driver.find_elements(
-                By.XPATH,
-                "//a[contains(@href, 'linkedin.com/in/')]//span[@aria-hidden='true']"
-            )
+            all_name_links = self.selectors.find_all("profile_name_spans")
 
             # Find the closest one to our button
             if all_name_links:
@@ -827,10 +2568,7 @@ class LinkedInAutomator:
                     pass
 
             # Legacy light-DOM fallback (kept for resilience)
-            strong_elements = self.driver.find_elements(
-                By.XPATH,
-                "//div[@data-test-modal]//div[contains(@class, 'artdeco-modal__content')]//strong | "
-                "//div[contains(@class, 'artdeco-modal')]//div[contains(@class, 'artdeco-modal__content')]//strong")
+            strong_elements = self.selectors.find_all("modal_name_strong")
             for el in strong_elements:
                 text = el.text.strip()
                 if text:
@@ -839,10 +2577,7 @@ class LinkedInAutomator:
                     return first_name
 
             # Look for the specific name structure in the modal
-            modal_name_elements = self.driver.find_elements(
-                By.XPATH,
-                "//div[contains(@class, 'artdeco-modal')]//span[@aria-hidden='true']"
-            )
+            modal_name_elements = self.selectors.find_all("modal_name_spans")
 
             for elem in modal_name_elements:
                 name_text = elem.text.strip()
@@ -855,32 +2590,28 @@ class LinkedInAutomator:
                     logger.debug(f"Extracted name from modal: {first_name}")
                     return first_name
 
-            # Try alternative selectors if the above didn't work
-            selectors = [
-                "//div[contains(@class, 'artdeco-modal')]//h2",
-                "//div[contains(@class, 'artdeco-modal')]//h3",
-                "//div[contains(@class, 'send-invite')]//h2"
-            ]
-
-            for selector in selectors:
+            # Try the modal title headings if the above didn't work
+            try:
+                elements = self.selectors.find_all("modal_title", all_matches=True)
+            except Exception:
+                elements = []
+            for element in elements:
                 try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        text = element.text.strip()
-                        if text:
-                            # Common patterns in the modal title
-                            if "Connect with " in text:
-                                name = text.replace("Connect with ", "")
-                                first_name = name.split()[0]
-                                logger.debug(f"Extracted name from modal title: {first_name}")
-                                return first_name
-                            elif "Invite " in text and " to connect" in text:
-                                name = text.replace("Invite ", "").replace(" to connect", "")
-                                first_name = name.split()[0]
-                                logger.info(f"Extracted name from invitation text: {first_name}")
-                                return first_name
-                except:
+                    text = element.text.strip()
+                except Exception:
                     continue
+                if text:
+                    # Common patterns in the modal title
+                    if "Connect with " in text:
+                        name = text.replace("Connect with ", "")
+                        first_name = name.split()[0]
+                        logger.debug(f"Extracted name from modal title: {first_name}")
+                        return first_name
+                    elif "Invite " in text and " to connect" in text:
+                        name = text.replace("Invite ", "").replace(" to connect", "")
+                        first_name = name.split()[0]
+                        logger.info(f"Extracted name from invitation text: {first_name}")
+                        return first_name
 
             logger.debug("Could not extract name from modal")
             return None
@@ -896,6 +2627,15 @@ class LinkedInAutomator:
         profiles show "Pending" and existing connections show "Message", both of
         which are naturally excluded by the selector below.
         """
+        try:
+            return self._process_page()
+        finally:
+            # Whatever way the page ends, keep the last candidate's timings
+            self._finish_invite_timing()
+
+    def _process_page(self):
+        self._page_number = self._current_page_number()
+
         # Wait for the new search results UI to load
         try:
             self.wait.until(EC.presence_of_element_located(
@@ -903,78 +2643,109 @@ class LinkedInAutomator:
         except:
             logger.warning("Could not find search results, trying to continue anyway")
 
-        # Nudge the lazy-loaded result list so every profile renders before we start
-        try:
-            for _ in range(3):
-                self.driver.execute_script("window.scrollBy(0, document.body.scrollHeight/3);")
-                time.sleep(0.5)
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(0.5)
-        except:
-            pass
-
-        # Connect controls are anchors exposing aria-label="Invite <Name> to connect"
-        connect_xpath = ("//a[starts-with(@aria-label, 'Invite ') and "
-                         "contains(@aria-label, 'to connect')]")
+        # Let the lazy-loaded result list render every profile before we start
+        self.wait_for_results_list()
 
         # Track profiles we've already attempted by their aria-label. A successful
-        # invite turns the anchor into "Pending", so it leaves the selector anyway,
+        # invite turns the anchor into "Pending", so it leaves the snapshot anyway,
         # but this also guards against re-finding an unchanged element.
         processed_labels = set()
 
+        # Connect candidates still to try, taken from one page snapshot. When it
+        # runs dry we snapshot again to pick up rows that rendered late.
+        candidates = []
+        # First names and ready-to-type notes for this page's candidates,
+        # produced in one batch per snapshot (label -> name / note)
+        page_names = {}
+        page_notes = {}
+
         while True:
+            # Apply edits to the message file before starting the next invite
+            if self.message_watcher is not None and self.message_watcher.changed():
+                if self.reload_message_templates():
+                    page_notes = self.prerender_notes(candidates, page_names)
+
             # Check for invitation limit warning before processing each profile
             if not self.check_invitation_limit_warning():
                 logger.info("Stopping automation due to invitation limit or user choice.")
                 return False  # Signal to stop the automation
 
-            # Re-find anchors each iteration to avoid stale references
-            connect_links = self.driver.find_elements(By.XPATH, connect_xpath)
-
+            locate_start = time.perf_counter()
+            if not candidates:
+                candidates = [c for c in self.snapshot_candidates()
+                              if c["state"] == "connect" and c["label"] not in processed_labels]
+                # Drop people already sent / failed / dead-ended in earlier runs
+                # before spending any modal round-trips on them
+                if self.ledger is not None and candidates:
+                    known = [c for c in candidates if self.ledger.should_skip(self._ledger_key(c))]
+                    if known:
+                        for c in known:
+                            processed_labels.add(c["label"])
+                            logger.debug(f"Ledger: skipping {c['label']} "
+                                         f"({self.ledger.get(self._ledger_key(c))['outcome']} earlier)")
+                        self.ledger_skipped += len(known)
+                        candidates = [c for c in candidates if c["label"] not in processed_labels]
+                        logger.info(f"Skipped {len(known)} profile(s) already in the ledger")
+                page_names.update(self.extract_names_from_aria_labels(c["label"] for c in candidates))
+                page_notes.update(self.prerender_notes(candidates, page_names))
+
+            # Re-find only the element we are about to click (fresh reference,
+            # so no stale-element problems after earlier invites)
             target = None
             target_label = None
-            for link in connect_links:
-                try:
-                    label = link.get_attribute("aria-label")
-                except Exception:
-                    continue
-                if label and label not in processed_labels:
-                    target = link
-                    target_label = label
-                    break
+            candidate = None
+            popped_any = False
+            while candidates and target is None:
+                candidate = candidates.pop(0)
+                processed_labels.add(candidate["label"])
+                popped_any = True
+                found = self.driver.find_elements(
+                    By.XPATH, "//a[@aria-label=" + self._xpath_literal(candidate["label"]) + "]")
+                if found:
+                    target = found[0]
+                    target_label = candidate["label"]
 
             if target is None:
+                if popped_any:
+                    continue  # some rows vanished; take a fresh snapshot
                 logger.info("No more Connect controls to process on this page")
                 break
 
-            processed_labels.add(target_label)
+            self._start_invite_timing(target_label, time.perf_counter() - locate_start)
 
             # Most reliable name source: the Connect anchor's own aria-label
-            name = self.extract_name_from_aria_label(target_label)
+            name = page_names.get(target_label) or self.extract_name_from_aria_label(target_label)
             if name:
                 logger.info(f"Processing {target_label} -> using first name: {name}")
 
             try:
                 # Scroll to the Connect control
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", target)
-                time.sleep(random.uniform(1, 2))  # Random delay to appear more human-like
+                with self._phase("click_connect"):
+                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", target)
+                self._pace(1, 2)  # Random delay to appear more human-like
 
                 # Click the Connect control with a REAL (trusted) click. LinkedIn's
                 # handler that opens the invite modal ignores synthetic JS clicks
                 # (event.isTrusted == false), so a native Selenium click is required;
                 # _robust_click falls back to JS only if the native click is blocked.
-                self._robust_click(target, f"Connect control ({target_label})")
-                time.sleep(3)  # Give the modal a moment to fully open before interacting
+                with self._phase("click_connect"):
+                    self._robust_click(target, f"Connect control ({target_label})")
+                # Give the modal a moment to fully open before interacting. Returns
+                # as soon as its buttons (or the email screen) render; 3 s is the cap.
+                with self._phase("settle_after_connect"):
+                    self.wait_for_ui("modal_ready", 3)
 
                 # The invite modal renders inside the #interop-outlet Shadow DOM.
                 # Selenium can't reach it with XPath/By.ID, so grab the shadow root
                 # and drive the modal through it with CSS selectors.
-                shadow = self.get_modal_shadow_root(timeout=10)
+                with self._phase("get_modal_shadow_root"):
+                    shadow = self.get_modal_shadow_root(timeout=10)
                 if shadow is None:
                     if not self.check_invitation_limit_warning():
                         return False
                     logger.warning(f"No modal appeared when clicking Connect for {target_label}. Skipping.")
                     self.connections_skipped += 1
+                    self._record_outcome(candidate, "skipped-no-modal")
                     continue
 
                 # Check again for limit reached after clicking connect
@@ -989,7 +2760,8 @@ class LinkedInAutomator:
                     self.dismiss_open_modal()
                     self.wait_modal_closed(shadow, timeout=3)
                     self.connections_skipped += 1
-                    time.sleep(random.uniform(1, 2))
+                    self._record_outcome(candidate, "skipped-email")
+                    self._pace(1, 2)
                     continue
 
                 # If name wasn't found from the aria-label, try to extract it from the modal
@@ -998,48 +2770,64 @@ class LinkedInAutomator:
 
                 # If no_message flag is enabled, click "Send without a note" button
                 if self.no_message:
-                    send_without_note_btn = self.find_in_shadow(
-                        shadow, "button[aria-label='Send without a note']", require_enabled=True)
+                    with self._phase("find_send_without_note"):
+                        send_without_note_btn = self.find_in_shadow(
+                            shadow, "button[aria-label='Send without a note']", require_enabled=True)
                     if send_without_note_btn is None:
                         if not self.check_invitation_limit_warning():
                             return False
                         logger.warning(f"No 'Send without a note' button found for {target_label}. Skipping.")
                         self.connections_skipped += 1
+                        self._record_outcome(candidate, "skipped-modal-error")
                         continue
-                    self._robust_click(send_without_note_btn, "Send without a note button")
+                    self._mark_send()
+                    with self._phase("click_send"):
+                        self._robust_click(send_without_note_btn, "Send without a note button")
                     logger.info(f"Sending invitation without a note to {name or target_label}")
                 else:
                     # Otherwise, follow the original flow with a note
-                    add_note_btn = self.find_in_shadow(
-                        shadow, "button[aria-label='Add a note']", require_enabled=True)
+                    with self._phase("find_add_note"):
+                        add_note_btn = self.find_in_shadow(
+                            shadow, "button[aria-label='Add a note']", require_enabled=True)
                     if add_note_btn is None:
                         if not self.check_invitation_limit_warning():
                             return False
                         logger.warning(f"No 'Add a note' button found for {target_label}. Skipping.")
                         self.connections_skipped += 1
+                        self._record_outcome(candidate, "skipped-modal-error")
                         continue
-                    self._robust_click(add_note_btn, "Add a note button")
+                    with self._phase("click_add_note"):
+                        self._robust_click(add_note_btn, "Add a note button")
 
                     # Wait for the note text area (still inside the same shadow root)
-                    message_box = self.find_in_shadow(shadow, "#custom-message")
+                    with self._phase("find_message_box"):
+                        message_box = self.find_in_shadow(shadow, "#custom-message")
                     if message_box is None:
                         if not self.check_invitation_limit_warning():
                             return False
                         logger.warning(f"No message box appeared for {target_label}. Skipping.")
                         self.connections_skipped += 1
+                        self._record_outcome(candidate, "skipped-modal-error")
                         continue
 
-                    # Prepare personalized message
-                    personalized_message = self.personalize_message(name)
+                    # Personalized note, rendered with the rest of the page after the
+                    # snapshot. Rendered here only if it wasn't, or if the name
+                    # had to come from the modal instead of the aria-label.
+                    personalized_message = page_notes.pop(target_label, None)
+                    if personalized_message is None or (name and not page_names.get(target_label)):
+                        personalized_message = self.prerender_notes([candidate], {target_label: name})[target_label]
 
                     # Debug output to verify message preparation
                     logger.info(f"Sending message to {name or target_label}: {personalized_message.splitlines()[0] if personalized_message else ''}")
 
                     # Type the note so LinkedIn registers it and enables Send
-                    self.fill_message_box(message_box, personalized_message)
+                    with self._phase("fill_message_box"):
+                        self.fill_message_box(message_box, personalized_message)
 
-                    # Wait a moment for the Send button to be enabled
-                    time.sleep(1)
+                    # Wait a moment for the Send button to be enabled (event-driven,
+                    # at most 1 s)
+                    with self._phase("settle_after_fill"):
+                        self.wait_for_ui("send_enabled", 1)
 
                     # DEBUG: report what LinkedIn actually has in the textarea
                     try:
@@ -1051,14 +2839,16 @@ class LinkedInAutomator:
                         pass
 
                     # Find the Send button (enabled only once the note registers)
-                    send_btn = self.find_in_shadow(
-                        shadow, "button[aria-label='Send invitation']", require_enabled=True)
+                    with self._phase("find_send"):
+                        send_btn = self.find_in_shadow(
+                            shadow, "button[aria-label='Send invitation']", require_enabled=True)
                     if send_btn is None:
                         if not self.check_invitation_limit_warning():
                             return False
                         logger.warning(f"Send button never became clickable for {target_label} "
                               f"(note may not have registered). Skipping.")
                         self.connections_skipped += 1
+                        self._record_outcome(candidate, "skipped-modal-error")
                         continue
 
                     # Scroll the Send button into view and click it (trusted click)
@@ -1067,26 +2857,36 @@ class LinkedInAutomator:
                             "arguments[0].scrollIntoView({block: 'center'});", send_btn)
                     except Exception:
                         pass
-                    logger.debug(f"Clicking Send (enabled={send_btn.is_enabled()}) for {target_label}")
-                    self._robust_click(send_btn, "Send invitation button")
-
-                # Wait for the modal to close (it leaves the shadow root when sent)
-                if not self.wait_modal_closed(shadow, timeout=5):
+                    self._mark_send()
+                    with self._phase("click_send"):
+                        logger.debug(f"Clicking Send (enabled={send_btn.is_enabled()}) for {target_label}")
+                        self._robust_click(send_btn, "Send invitation button")
+
+                # Modal closing, the invite request's HTTP status and the row
+                # turning Pending are awaited together
+                full_name = full_name_from_aria_label(target_label)
+                result = self.await_send_result(shadow, target_label, full_name)
+                if result == "modal-stuck":
                     if not self.check_invitation_limit_warning():
                         return False
                     logger.warning(f"Modal never closed for {target_label}. Skipping.")
+                    self._record_outcome(candidate, "modal-stuck")
                     continue
 
                 # Network-level rate-limit guard: if the Send POST came back 429,
                 # we're out of quota - stop now even if the UI showed no dialog.
-                if self.detect_rate_limit_429():
+                if result == "rate-limited":
+                    self._record_outcome(candidate, "rate-limited")
+                    return False
+
+                # Limit dialog already handled in await_send_result: just stop.
+                # Nothing goes in the ledger, so the person is retried next run.
+                if result == "limit-stop":
                     return False
 
-                # Verify the invitation actually registered (person turned Pending)
-                m = re.match(r"Invite\s+(.+?)\s+to connect", target_label)
-                full_name = m.group(1) if m else None
-                if self.verify_successful_invitation_sent(target_label, full_name):
+                if result == "sent":
                     self.connections_sent += 1
+                    self._record_outcome(candidate, "sent")
                     logger.info(
                         f"Invitation sent to {name or target_label} "
                         f"[sent={self.connections_sent}, failed={self.connections_failed}, "
@@ -1097,16 +2897,18 @@ class LinkedInAutomator:
                     if not self.check_invitation_limit_warning():
                         return False
                     self.connections_failed += 1
+                    self._record_outcome(candidate, "failed")
                     logger.warning(
                         f"Invite to {target_label} did not register; moving to next person "
                         f"[sent={self.connections_sent}, failed={self.connections_failed}, "
                         f"skipped={self.connections_skipped}]")
 
                 # Random delay between invitations to appear more human-like
-                time.sleep(random.uniform(3, 5))
+                self._pace(3, 5)
 
             except ElementClickInterceptedException:
                 logger.warning(f"Connect control for {target_label} was intercepted by another element")
+                self._record_outcome(candidate, "error")
                 # Check if it's the invitation limit warning
                 if not self.check_invitation_limit_warning():
                     return False
@@ -1116,6 +2918,7 @@ class LinkedInAutomator:
 
             except Exception as e:
                 logger.error(f"Error processing {target_label}: {str(e)}")
+                self._record_outcome(candidate, "error")
                 # Check if it's the invitation limit warning
                 if not self.check_invitation_limit_warning():
                     return False
@@ -1128,6 +2931,111 @@ class LinkedInAutomator:
 
         return True  # Continue automation
 
+    # Snapshot of every search-result row in one call. For each row: the
+    # aria-label of its action control, the profile URL (query string dropped),
+    # the display name and the row state: connect / pending / message / follow
+    # (or unknown). Falls back to treating each Connect anchor as its own row
+    # when the page has no role="listitem" containers.
+    CANDIDATES_JS = """
+        const RULES = [
+            ["connect", /^Invite (.+) to connect$/],
+            ["pending", /^Pending, click to withdraw invitation sent to (.+)$/],
+            ["message", /^(?:Send a message to|Message) (.+)$/],
+            ["follow", /^Follow (.+)$/],
+        ];
+        let rows = Array.from(document.querySelectorAll("div[role='listitem']"));
+        if (!rows.length) {
+            rows = Array.from(document.querySelectorAll(
+                "a[aria-label^='Invite '][aria-label$=' to connect']"))
+                .map(a => a.closest("li") || a.parentElement);
+        }
+        const out = [];
+        for (const row of rows) {
+            const controls = Array.from(row.querySelectorAll("a[aria-label], button[aria-label]"));
+            let state = "unknown", label = null, name = null;
+            for (const [kind, re] of RULES) {
+                const el = controls.find(c => (kind !== "connect" || c.tagName === "A") &&
+                                              re.test(c.getAttribute("aria-label")));
+                if (el) {
+                    state = kind;
+                    label = el.getAttribute("aria-label");
+                    name = label.match(re)[1].trim();
+                    break;
+                }
+            }
+            const profile = row.querySelector("a[href*='linkedin.com/in/']");
+            if (!name && profile) {
+                const span = profile.querySelector("span[aria-hidden='true']");
+                name = ((span || profile).innerText || "").split("\\n")[0].trim() || null;
+            }
+            // Headline is the paragraph right after the one with the name;
+            // "Current: <title> at <company>" is its own paragraph
+            const texts = Array.from(row.querySelectorAll("p"))
+                .map(p => (p.innerText || "").trim()).filter(Boolean);
+            const nameAt = name ? texts.findIndex(t => t.includes(name)) : -1;
+            out.push({
+                label: label,
+                href: profile ? profile.href.split("?")[0] : null,
+                name: name,
+                state: state,
+                headline: nameAt >= 0 && nameAt + 1 < texts.length ? texts[nameAt + 1] : null,
+                current: texts.find(t => /^current:/i.test(t)) || null,
+            });
+        }
+        return out;
+    """
+
+    def snapshot_candidates(self):
+        """Return every result row on the current page from a single script call.
+
+        Each entry is a dict with label (aria-label of the row's action control),
+        href (profile URL), name (display name), state ("connect", "pending",
+        "message", "follow" or "unknown"), headline and current (the row's
+        "Current: ..." line, if shown). process_page() works from this list
+        instead of re-running find_elements + get_attribute per anchor on every
+        iteration. Returns [] if the snapshot fails.
+        """
+        try:
+            return self.driver.execute_script(self.CANDIDATES_JS) or []
+        except Exception as e:
+            logger.debug(f"Candidate snapshot failed: {type(e).__name__}: {e}")
+            return []
+
+    def parse_candidates(self):
+        """Same rows as snapshot_candidates(), from one page_source fetch.
+
+        The page HTML is transferred once and parsed in-process by
+        parse_search_results(), so listing and classifying a page costs a
+        single WebDriver call however many rows it has. Meant for read-only
+        analysis (--list-candidates): the rows carry no element references.
+        Returns [] if the page can't be read.
+        """
+        try:
+            return parse_search_results(self.driver.page_source, self.driver.current_url)
+        except Exception as e:
+            logger.debug(f"Page source parse failed: {type(e).__name__}: {e}")
+            return []
+
+    def list_candidates(self):
+        """Log every result row of the current page (state, name, first name, company).
+
+        Read-only: nothing is clicked. Returns the parsed rows.
+        """
+        self.select_search_tab()
+        self._page_number = self._current_page_number()
+        self.wait_for_results_list()
+        rows = self.parse_candidates()
+        states = {}
+        for row in rows:
+            states[row["state"]] = states.get(row["state"], 0) + 1
+            title, company = parse_headline(row["current"], row["headline"])
+            first_name = resolve_first_name(row["name"]) if row["name"] else None
+            logger.info(f"{row['state']:<8} {row['name'] or '?':<30} first name: {first_name or '?':<15} "
+                        f"{company or ''}")
+        logger.info(f"Page {self._page_number}: {len(rows)} rows ("
+                    + ", ".join(f"{n} {state}" for state, n in sorted(states.items())) + ")")
+        return rows
+
     def select_search_tab(self):
         """Switch the driver to the tab that shows LinkedIn people-search results.
 
@@ -1136,6 +3044,10 @@ class LinkedInAutomator:
         find_element come back empty. We scan all open tabs and switch to the
         people-search results tab so the rest of the run drives the right window.
         Returns True if a suitable tab was selected.
+
+        The tabs' URLs come from one CDP Target.getTargets call (ChromeDriver's
+        window handles are the DevTools target ids), so only the chosen tab is
+        switched to. If that isn't available, every tab is visited in turn.
         """
         try:
             handles = self.driver.window_handles
@@ -1143,14 +3055,20 @@ class LinkedInAutomator:
             logger.error(f"Could not enumerate browser tabs: {e}")
             return False
 
+        # One CDP call gives every tab's URL; otherwise visit the tabs in turn
+        tab_urls = self._tab_urls_cdp(handles)
+
         people_search = None
         any_search = None
         for h in handles:
-            try:
-                self.driver.switch_to.window(h)
-                url = (self.driver.current_url or "").lower()
-            except Exception:
-                continue
+            if tab_urls is not None:
+                url = tab_urls.get(h, "").lower()
+            else:
+                try:
+                    self.driver.switch_to.window(h)
+                    url = (self.driver.current_url or "").lower()
+                except Exception:
+                    continue
             if "linkedin.com/search/results/people" in url:
                 people_search = h
                 break
@@ -1160,7 +3078,7 @@ class LinkedInAutomator:
         chosen = people_search or any_search
         if chosen is not None:
             self.driver.switch_to.window(chosen)
-            logger.info(f"Using tab: {self.driver.current_url}")
+            logger.info(f"Using tab: {tab_urls[chosen] if tab_urls else self.driver.current_url}")
             return True
 
         logger.warning("no LinkedIn people-search tab found among the open tabs. "
@@ -1170,12 +3088,177 @@ class LinkedInAutomator:
             self.driver.switch_to.window(handles[0])
         return False
 
+    def _tab_urls_cdp(self, handles):
+        """{window handle: URL} for every open tab, from one Target.getTargets call.
+
+        Returns None if the CDP lookup fails or its target ids don't cover
+        every handle, so the caller falls back to switching to each tab.
+        """
+        try:
+            targets = self.driver.execute_cdp_cmd("Target.getTargets", {})["targetInfos"]
+        except Exception as e:
+            logger.debug(f"Target.getTargets failed ({type(e).__name__}: {e}); visiting tabs one by one")
+            return None
+        urls = {t["targetId"]: t.get("url") or "" for t in targets if t.get("type") == "page"}
+        if not set(handles) <= set(urls):
+            logger.debug("Target ids don't match the window handles; visiting tabs one by one")
+            return None
+        return urls
+
+    # Returns "ready" once result rows are rendered, "empty" for LinkedIn's
+    # no-results page (asked for a page past the last one), or null (keep waiting)
+    RESULTS_STATE_JS = """
+        if (document.querySelector("div[role='listitem'], a[aria-label^='Invite '][aria-label$=' to connect']"))
+            return "ready";
+        for (const h of document.querySelectorAll("main h2, main h3, h2")) {
+            if (/no results found/i.test(h.textContent || "")) return "empty";
+        }
+        return null;
+    """
+
+    # Readiness check for the lazy-loaded result list, run via
+    # execute_async_script. Scrolls down one viewport at a time; each step waits
+    # until the number of result rows and Connect anchors has not changed for
+    # quietMs (a MutationObserver restarts the quiet timer whenever a count
+    # changes). Once the bottom is reached and the counts are quiet, scrolls
+    # back to the top and resolves {rows, connect, steps, settled}; settled is
+    # false if timeoutMs ran out first. Arguments: quietMs, timeoutMs.
+    RESULTS_SETTLE_JS = """
+        const done = arguments[arguments.length - 1];
+        const [quietMs, timeoutMs] = arguments;
+        const ROWS = "div[role='listitem']";
+        const CONNECT = "a[aria-label^='Invite '][aria-label$=' to connect']";
+        const counts = () => [document.querySelectorAll(ROWS).length,
+                              document.querySelectorAll(CONNECT).length];
+        const atBottom = () => window.innerHeight + window.scrollY >=
+            document.documentElement.scrollHeight - 2;
+        let last = counts(), steps = 0, finished = false, quiet = null;
+        const finish = settled => {
+            if (finished) return;
+            finished = true;
+            observer.disconnect();
+            clearTimeout(quiet);
+            clearTimeout(deadline);
+            window.scrollTo(0, 0);
+            last = counts();
+            done({rows: last[0], connect: last[1], steps: steps, settled: settled});
+        };
+        const step = () => {
+            if (atBottom()) { finish(true); return; }
+            window.scrollBy(0, window.innerHeight);
+            steps++;
+            arm();
+        };
+        const arm = () => { clearTimeout(quiet); quiet = setTimeout(step, quietMs); };
+        const observer = new MutationObserver(() => {
+            const now = counts();
+            if (now[0] !== last[0] || now[1] !== last[1]) { last = now; arm(); }
+        });
+        observer.observe(document.body, {childList: true, subtree: true});
+        const deadline = setTimeout(() => finish(false), timeoutMs);
+        arm();
+    """
+
+    # How long the result counts must stay unchanged before the list (or the
+    # part of it scrolled into view) is considered rendered
+    RESULTS_QUIET_MS = 300
+
+    def wait_for_results_list(self, timeout=8):
+        """Scroll the lazy-loaded result list into view and wait for it to settle.
+
+        Replaces the fixed scroll-and-sleep prelude: a short page returns after
+        one quiet period, and a long page is not processed before its lower rows
+        render. Returns the number of result rows loaded (None if the check
+        could not run, in which case the old blind scroll is used instead).
+        """
+        started = time.perf_counter()
+        try:
+            state = self.driver.execute_async_script(
+                self.RESULTS_SETTLE_JS, self.RESULTS_QUIET_MS, int(timeout * 1000))
+        except Exception as e:
+            logger.debug(f"Result list readiness check failed ({type(e).__name__}: {e}); "
+                         f"scrolling blindly instead")
+            try:
+                for _ in range(3):
+                    self.driver.execute_script("window.scrollBy(0, document.body.scrollHeight/3);")
+                    time.sleep(0.5)
+                self.driver.execute_script("window.scrollTo(0, 0);")
+                time.sleep(0.5)
+            except Exception:
+                pass
+            return None
+
+        elapsed = time.perf_counter() - started
+        if state["settled"]:
+            logger.info(f"Result list ready: {state['rows']} rows, {state['connect']} Connect "
+                        f"({elapsed:.2f}s, {state['steps']} scroll steps)")
+        else:
+            logger.warning(f"Result list still changing after {timeout}s; continuing with "
+                           f"{state['rows']} rows, {state['connect']} Connect")
+        log_event("page_ready", page=self._page_number, rows=state["rows"],
+                  connect=state["connect"], settled=state["settled"], seconds=round(elapsed, 3))
+        return state["rows"]
+
+    def load_results_page(self, page):
+        """Open results page `page` of the current search by URL.
+
+        Completion is detected by waiting for result rows to render (no fixed
+        sleep). Returns "ready", "empty" (LinkedIn's no-results page: past the
+        last page) or "timeout" (nothing rendered, even after one reload).
+        """
+        url = self._url_with_page(self.driver.current_url, page)
+        for attempt in range(2):
+            logger.info(f"Loading results page {page}: {url}")
+            self.driver.get(url)
+            try:
+                state = self.wait.until(lambda d: d.execute_script(self.RESULTS_STATE_JS))
+            except TimeoutException:
+                logger.warning(f"No search results rendered on page {page}"
+                               + (", retrying once" if attempt == 0 else ""))
+                continue
+            if state == "empty":
+                logger.info(f"Page {page} has no results (past the last page)")
+            return state
+        return "timeout"
+
     def go_to_next_page(self):
-        """Go to the next or previous page of search results depending on reverse setting. Returns False if no navigation is possible."""
+        """Go to the next or previous page of search results depending on reverse setting.
+
+        Returns "moved", "end" (no more pages: first/last page, the requested
+        end page or a page with no results), "stop" (invitation limit) or
+        "error" (the next page could not be loaded; the run can be resumed).
+        """
+        # Check for invitation limit warning before navigating
+        if not self.check_invitation_limit_warning():
+            return "stop"
+
+        current = self._current_page_number()
+        if self.end_page is not None and (current <= self.end_page if self.reverse
+                                          else current >= self.end_page):
+            logger.info(f"Reached the requested last page ({self.end_page})")
+            return "end"
+
+        if self.navigation == "click":
+            return "moved" if self._click_to_next_page() else "end"
+
+        # Direct navigation: the next page is just page=N+1 (or N-1 in reverse)
+        target = current - 1 if self.reverse else current + 1
+        if target < 1:
+            logger.info("Reached first page (page 1)")
+            return "end"
+        if target > LAST_RESULTS_PAGE:
+            logger.info(f"Reached LinkedIn's page limit (page {LAST_RESULTS_PAGE})")
+            return "end"
+        try:
+            state = self.load_results_page(target)
+        except Exception as e:
+            logger.error(f"Error navigating to page {target}: {str(e)}")
+            return "error"
+        return {"ready": "moved", "empty": "end"}.get(state, "error")
+
+    def _click_to_next_page(self):
+        """Click LinkedIn's Next/Previous pagination button (--navigation click)."""
         try:
-            # Check for invitation limit warning before navigating
-            if not self.check_invitation_limit_warning():
-                return False
 
             # The new pagination control uses stable data-testid attributes. The
             # active button ends in "-visible"; an unavailable one ends in
@@ -1216,8 +3299,8 @@ class LinkedInAutomator:
             # Boundary checks based on the currently highlighted page indicator
             if self.reverse:
                 try:
-                    current_page_elem = self.driver.find_element(By.XPATH, "//button[@aria-current='true']")
-                    if current_page_elem.text.strip() == "1":
+                    current_page_elem = self.selectors.find("current_page")
+                    if current_page_elem and current_page_elem.text.strip() == "1":
                         logger.info("Reached first page (page 1)")
                         return False
                 except:
@@ -1226,8 +3309,8 @@ class LinkedInAutomator:
             # If going forward, check if we've reached page 100 (LinkedIn limit)
             else:
                 try:
-                    current_page_elem = self.driver.find_element(By.XPATH, "//button[@aria-current='true']")
-                    if current_page_elem.text.strip() == "100":
+                    current_page_elem = self.selectors.find("current_page")
+                    if current_page_elem and current_page_elem.text.strip() == "100":
                         logger.info("Reached LinkedIn's page limit (page 100)")
                         return False
                 except:
@@ -1242,7 +3325,7 @@ class LinkedInAutomator:
             current_url = self.driver.current_url
 
             # Click the button with a real (trusted) click, JS as fallback
-            self._robust_click(nav_button)
+            self._robust_click(nav_button, "pagination button")
 
             # Wait for the page to load
             time.sleep(5)
@@ -1253,8 +3336,9 @@ class LinkedInAutomator:
 
             # Additional check: try to find a loading indicator or wait for it to disappear
             try:
-                loading_element = self.driver.find_element(By.XPATH, "//div[contains(@class, 'loading')]")
-                self.wait.until(EC.staleness_of(loading_element))
+                loading_element = self.selectors.find("loading_indicator")
+                if loading_element:
+                    self.wait.until(EC.staleness_of(loading_element))
             except:
                 # If no loading indicator found, just continue
                 pass
@@ -1269,9 +3353,127 @@ class LinkedInAutomator:
             logger.error(f"Error navigating to {'previous' if self.reverse else 'next'} page: {str(e)}")
             return False
 
-    def run_automation(self, max_pages=100):
-        """Run the full automation process."""
+    @staticmethod
+    def _url_with_page(url, page):
+        """Return the search URL with its page= parameter set to page."""
+        parts = urlparse(url)
+        query = parse_qs(parts.query, keep_blank_values=True)
+        query["page"] = [str(page)]
+        return urlunparse(parts._replace(query=urlencode(query, doseq=True)))
+
+    def _current_page_number(self):
+        """LinkedIn page number of the current results page (from ?page=, else 1)."""
+        try:
+            query = parse_qs(urlparse(self.driver.current_url).query)
+            return int(query.get("page", ["1"])[0])
+        except Exception:
+            return 1
+
+    def save_checkpoint(self, page_num, completed=False):
+        """Persist where the run is, so a crash costs at most one page.
+
+        Saved at the start of every page and again once it is processed: the
+        search URL, the LinkedIn page number, the session's page count, the
+        direction, the session counters and how many lines the ledger had.
+        Written to a temp file and renamed, so an interrupted write never
+        leaves a truncated checkpoint behind.
+        """
+        if not self.checkpoint_file:
+            return
+        try:
+            url = self.driver.current_url
+            checkpoint = {
+                "search_url": url,
+                "page": self._current_page_number(),
+                "page_num": page_num,
+                "reverse": self.reverse,
+                "completed": completed,
+                "counters": {
+                    "sent": self.connections_sent,
+                    "failed": self.connections_failed,
+                    "skipped": self.connections_skipped,
+                    "ledger_skipped": self.ledger_skipped,
+                },
+                "ledger_lines": self._flushed_ledger_lines(),
+                "ts": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            }
+            tmp = self.checkpoint_file + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(checkpoint, f, indent=2)
+            os.replace(tmp, self.checkpoint_file)
+        except Exception as e:
+            logger.warning(f"Could not save checkpoint: {e}")
+
+    def _flushed_ledger_lines(self):
+        """Lines in the ledger file once the queued records are written.
+
+        The checkpoint's counters already include every queued record, so the
+        line count saved with them has to include those records too.
+        """
+        if self.ledger is None:
+            return None
+        self.ledger.flush()
+        return self.ledger.line_count
+
+    def resume_from_checkpoint(self):
+        """Navigate straight to the page saved in the checkpoint.
+
+        Restores the direction and session counters too. Invites recorded in
+        the ledger after the checkpoint was saved (a page cut short by a crash)
+        are added to the counters, since the resumed run skips those people
+        through the ledger and would never count them. Returns the session
+        page count to continue from, or None if there is nothing to resume
+        (no checkpoint, unreadable, or the previous run already finished).
+        """
+        if not self.checkpoint_file or not os.path.exists(self.checkpoint_file):
+            logger.warning("--resume given but no checkpoint found; starting from the current tab.")
+            return None
+        try:
+            with open(self.checkpoint_file, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not read checkpoint ({e}); starting from the current tab.")
+            return None
+        if checkpoint.get("completed"):
+            logger.info("Checkpoint says the previous run finished; starting from the current tab.")
+            return None
+
+        if checkpoint.get("reverse", self.reverse) != self.reverse:
+            logger.info(f"Resuming in the checkpoint's direction "
+                        f"({'reverse' if checkpoint['reverse'] else 'forward'}).")
+        self.reverse = checkpoint.get("reverse", self.reverse)
+        counters = checkpoint.get("counters", {})
+        self.connections_sent = counters.get("sent", 0)
+        self.connections_failed = counters.get("failed", 0)
+        self.connections_skipped = counters.get("skipped", 0)
+        self.ledger_skipped = counters.get("ledger_skipped", 0)
+        if self.ledger is not None and checkpoint.get("ledger_lines") is not None:
+            later = self.ledger.outcomes_since(checkpoint["ledger_lines"])
+            skipped = sum(n for outcome, n in later.items() if outcome.startswith("skipped-"))
+            self.connections_sent += later.get("sent", 0)
+            self.connections_failed += later.get("failed", 0)
+            self.connections_skipped += skipped
+            if later:
+                logger.info(f"Counted {sum(later.values())} ledger record(s) written after the checkpoint "
+                            f"(sent: {later.get('sent', 0)}, failed: {later.get('failed', 0)}, "
+                            f"skipped: {skipped})")
+
+        url = self._url_with_page(checkpoint["search_url"], checkpoint["page"])
+        logger.info(f"Resuming at page {checkpoint['page']} (saved {checkpoint.get('ts')}): {url}")
+        self.driver.get(url)
+        return checkpoint.get("page_num", 1)
+
+    def run_automation(self, max_pages=100, resume=False, start_page=None, end_page=None):
+        """Run the full automation process.
+
+        With resume=True the run continues from the saved checkpoint instead
+        of the page the tab is currently on. start_page jumps to that results
+        page first; end_page is the last page to process (with reverse=True
+        the run counts down to it). Both are ignored when resuming. The
+        checkpoint is marked completed only when the results really ran out.
+        """
         page_num = 1
+        reached_end = False
 
         # Keep the PC awake for the entire run
         self._prevent_sleep()
@@ -1280,9 +3482,26 @@ class LinkedInAutomator:
         # (Selenium may attach to a different tab of an existing browser).
         self.select_search_tab()
 
+        resumed = None
+        if resume:
+            resumed = self.resume_from_checkpoint()
+            page_num = resumed or page_num
+        self.end_page = None if resumed else end_page
+        if start_page and not resumed and start_page != self._current_page_number():
+            state = self.load_results_page(start_page)
+            if state != "ready":
+                logger.error(f"Start page {start_page} "
+                             f"{'has no results' if state == 'empty' else 'did not load'}; stopping.")
+                self._allow_sleep()
+                return
+
+        log_event("run_start", page_num=page_num, reverse=self.reverse,
+                  no_message=self.no_message, resume=resume)
+
         try:
             while page_num <= max_pages:
                 logger.info(f"--- Processing page {page_num} ---")
+                self.save_checkpoint(page_num)
 
                 # Check for invitation limit warning before starting the page
                 if not self.check_invitation_limit_warning():
@@ -1292,29 +3511,54 @@ class LinkedInAutomator:
                 # Process Connect buttons only. People who can only be followed (no
                 # Connect button) are intentionally skipped - we only want real
                 # connection requests.
-                if not self.process_page():
+                page_done = self.process_page()
+                # Save the counters for this page before moving on (or stopping)
+                self.save_checkpoint(page_num)
+                if not page_done:
                     logger.info("Automation stopped due to invitation limit or user choice.")
                     break
 
                 # Try to go to next/previous page based on reverse setting
-                if not self.go_to_next_page():
+                step = self.go_to_next_page()
+                if step == "end":
                     direction = "first" if self.reverse else "last"
-                    logger.info(f"Reached the {direction} page or encountered an error")
+                    logger.info(f"Reached the {direction} page")
+                    reached_end = True
+                    break
+                if step == "stop":
+                    logger.info("Stopping automation due to invitation limit detection.")
+                    break
+                if step != "moved":
+                    logger.warning("Could not load the next page; stopping. "
+                                   "Run again with --resume to continue from here.")
                     break
 
                 page_num += 1
 
                 # Random delay between pages
-                time.sleep(random.uniform(3, 5))
+                self._pace(3, 5)
         finally:
             self._allow_sleep()
+            self.click_stats.save()
+
+        if reached_end:
+            self.save_checkpoint(page_num, completed=True)
+
+        log_event("run_end", pages=page_num, reached_end=reached_end,
+                  sent=self.connections_sent, failed=self.connections_failed,
+                  skipped=self.connections_skipped, ledger_skipped=self.ledger_skipped)
 
         direction = "reverse" if self.reverse else "forward"
         logger.info(f"Completed automation in {direction} direction! Processed {page_num} pages.")
         logger.info(
             f"Session summary — sent: {self.connections_sent} | "
             f"failed to register: {self.connections_failed} | "
-            f"skipped (email/modal issues): {self.connections_skipped}")
+            f"skipped (email/modal issues): {self.connections_skipped} | "
+            f"skipped (already in ledger): {self.ledger_skipped}")
+        for line in self.click_stats.summary_lines():
+            logger.info(f"Click hit rate — {line}")
+        for line in self.selectors.summary_lines():
+            logger.debug(f"Selector stats — {line}")
 
     def _prevent_sleep(self):
         """Tell Windows not to sleep or turn off the display while the bot runs."""
@@ -1339,6 +3583,13 @@ class LinkedInAutomator:
 
     def close(self):
         """Close the browser."""
+        if self.perf_consumer is not None:
+            self.perf_consumer.stop()
+        if self.message_watcher is not None:
+            self.message_watcher.stop()
+        if self.ledger is not None:
+            self.ledger.close()
+        self.click_stats.save()
         self.driver.quit()
 
 
@@ -1353,6 +3604,37 @@ def parse_arguments():
                         help='Navigate in reverse (use Previous button instead of Next)')
     parser.add_argument('-n', '--no-message', action='store_true',
                         help='Send invitations without a note')
+    parser.add_argument('--ledger', default=LEDGER_FILE,
+                        help=f'Invitation ledger used to skip profiles handled in earlier runs (default: {LEDGER_FILE})')
+    parser.add_argument('--no-ledger', action='store_true',
+                        help='Do not read or write the invitation ledger')
+    parser.add_argument('--resume', action='store_true',
+                        help=f'Continue from the page saved in {CHECKPOINT_FILE} instead of the current tab')
+    parser.add_argument('--perf-log', default='network', choices=PERF_LOG_PROFILES,
+                        help='What Chrome\'s performance log records for HTTP 429 detection: '
+                             'network (default, Network events only), all, or off')
+    parser.add_argument('--click-stats', default=CLICK_STATS_FILE,
+                        help=f'File where the learned click-strategy order is kept across runs '
+                             f'(default: {CLICK_STATS_FILE}); pass "" to keep it for this session only')
+    parser.add_argument('--name-locales', default=','.join(DEFAULT_NAME_LOCALES),
+                        help='Comma-separated given-name dictionaries (from names/) used to keep compound '
+                             'first names like "João Victor", e.g. pt,es,en,it (default: pt)')
+    parser.add_argument('--note-input', default='insert', choices=NOTE_INPUT_MODES,
+                        help='How the note is entered: insert (CDP insertText for most of it, then real '
+                             'keystrokes; default) or keys (one keystroke per character)')
+    parser.add_argument('--navigation', default='url', choices=NAVIGATION_MODES,
+                        help='How to change pages: url (load page=N directly, default) or click '
+                             '(click the Next/Previous button)')
+    parser.add_argument('--start-page', type=int, default=None,
+                        help='Results page to start from (default: the page the tab is on)')
+    parser.add_argument('--end-page', type=int, default=None,
+                        help='Last results page to process (with -r, the page to count down to)')
+    parser.add_argument('--events-file', default=EVENTS_FILE,
+                        help=f'Structured JSONL event log, appended to on every run (default: {EVENTS_FILE}); '
+                             f'pass "" to disable')
+    parser.add_argument('--list-candidates', action='store_true',
+                        help='Only list the result rows of the current page (state, name, company) '
+                             'from one page_source fetch, then exit without sending anything')
     parser.add_argument('-l', '--log-level', default='DEBUG',
                         choices=['DEBUG', 'INFO', 'WARN', 'ERROR'],
                         help='Console/file log verbosity (default: DEBUG)')
@@ -1367,6 +3649,8 @@ if __name__ == "__main__":
     # Map the friendly "WARN" choice to logging.WARNING
     level_name = "WARNING" if args.log_level == "WARN" else args.log_level
     setup_logging(level=getattr(logging, level_name, logging.DEBUG))
+    setup_event_log(args.events_file)
+    set_name_locales([loc.strip() for loc in args.name_locales.split(',') if loc.strip()])
 
     # Log the active run configuration up front
     logger.info("=" * 60)
@@ -1378,19 +3662,41 @@ if __name__ == "__main__":
     logger.info(f"  Navigation      : {'REVERSE (Previous)' if args.reverse else 'forward (Next)'}")
     logger.info(f"  Auto-continue   : {'on (-y) - skip close-to-limit prompts' if args.yes else 'off - will prompt near limit'}")
     logger.info(f"  Browser         : attach to existing (127.0.0.1:9222)")
+    logger.info(f"  Ledger          : {'off (--no-ledger)' if args.no_ledger else args.ledger}")
+    logger.info(f"  Resume          : {'yes, from ' + CHECKPOINT_FILE if args.resume else 'no'}")
+    logger.info(f"  Perf logging    : {args.perf_log}")
+    logger.info(f"  Click stats     : {args.click_stats or 'session only'}")
+    logger.info(f"  Name locales    : {args.name_locales}")
+    logger.info(f"  Note input      : {args.note_input}")
+    logger.info(f"  Page navigation : {args.navigation}"
+                + (f" (pages {args.start_page or 'current'} -> {args.end_page})" if args.end_page else
+                   f" (from page {args.start_page})" if args.start_page else ""))
+    if args.list_candidates:
+        logger.info(f"  List only       : yes (--list-candidates), parser: {'lxml' if lxml else 'html.parser'}")
     logger.info(f"  Log level       : {args.log_level}")
     logger.info(f"  Log file        : {LOG_FILE} (overwritten each run)")
+    logger.info(f"  Event log       : {args.events_file or 'off'} (JSONL, appended)")
     logger.info("=" * 60)
 
     # To use with an already opened browser, set use_existing_browser=True
     # Pass the auto_continue flag from command line arguments
     automator = LinkedInAutomator(use_existing_browser=True, auto_continue=args.yes,
                                   message_file=args.message, reverse=args.reverse,
-                                  no_message=args.no_message)
+                                  no_message=args.no_message,
+                                  ledger_file=None if args.no_ledger else args.ledger,
+                                  click_stats_file=args.click_stats or None,
+                                  note_input=args.note_input,
+                                  navigation=args.navigation,
+                                  perf_log_profile=args.perf_log)
+
+    if args.list_candidates:
+        automator.list_candidates()
+        sys.exit(0)
 
     try:
         # Run the automation
-        automator.run_automation(max_pages=100)
+        automator.run_automation(max_pages=100, resume=args.resume,
+                                 start_page=args.start_page, end_page=args.end_page)
     except KeyboardInterrupt:
         logger.warning("Automation stopped by user (Ctrl+C)")
     except Exception as e:
@@ -0,0 +1,125 @@
+"""Micro-benchmark for first-name resolution.
+
+Builds a large corpus of Brazilian-style full names ("João Victor Silva",
+"Maria de Lourdes Souza", "Ana Júlia Ferreira"...) and times
+resolve_first_name() cold (caches cleared before every pass) and warm, plus
+the batch API over "Invite <name> to connect" aria-labels. It then writes a
+copy of the Portuguese given-name list padded with thousands of extra entries
+and times it again, to check the per-name cost stays flat as the dictionary
+grows.
+
+Usage:
+    python name_benchmark.py
+    python name_benchmark.py --names 200000 --extra-given-names 10000
+"""
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+import main
+from main import (NAMES_DIR, _normalize_name_token, first_name_from_aria_label,
+                  first_names_from_aria_labels, resolve_first_name, set_name_locales,
+                  write_word_list)
+
+
+GIVEN = ["João", "José", "Maria", "Ana", "Pedro", "Lucas", "Gabriel", "Júlia", "Luíza", "Beatriz",
+         "Letícia", "Vitória", "Antônio", "Otávio", "Mateus", "Larissa", "Camila", "Rafael",
+         "Keyllane", "Thaís", "Wellington", "Cauã", "Heloísa", "Márcio"]
+SECOND = ["Victor", "Vitor", "Henrique", "Eduarda", "Clara", "Júlia", "Cecília", "Paulo",
+          "Luiz", "Augusto", "Gabriela", "Vinícius"]
+CONNECTED = ["Lourdes", "Fátima", "Conceição", "Jesus", "Aparecida"]
+SURNAMES = ["Silva", "Santos", "Oliveira", "Souza", "Rodrigues", "Ferreira", "Alves", "Pereira",
+            "Lima", "Gomes", "Ribeiro", "Carvalho", "Almeida", "Araújo", "Nascimento", "Conceição",
+            "Filgueira", "Magalhães", "Gonçalves", "Barbosa", "Rocha", "Dias", "Mendes", "Cavalcanti"]
+
+
+def build_corpus(size, seed=0):
+    """`size` full names, mixing single, compound and "de ..." first names."""
+    rng = random.Random(seed)
+    names = []
+    for _ in range(size):
+        kind = rng.random()
+        if kind < 0.15:
+            first = f"{rng.choice(['Maria', 'Ana'])} {rng.choice(['de', 'da', 'do'])} {rng.choice(CONNECTED)}"
+        elif kind < 0.45:
+            first = f"{rng.choice(GIVEN)} {rng.choice(SECOND)}"
+        else:
+            first = rng.choice(GIVEN)
+        surnames = " ".join(rng.sample(SURNAMES, rng.randint(1, 3)))
+        names.append(f"{first} {surnames}")
+    return names
+
+
+def clear_caches():
+    _normalize_name_token.cache_clear()
+    resolve_first_name.cache_clear()
+    first_name_from_aria_label.cache_clear()
+    main.name_dictionary.is_given_name.cache_clear()
+
+
+def time_per_call(fn, items, repeat=3):
+    """Best-of-`repeat` microseconds per item for fn(items)."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(items)
+        best = min(best, time.perf_counter() - started)
+    return best / len(items) * 1e6
+
+
+def run(names, labels):
+    def cold(items):
+        clear_caches()
+        for n in items:
+            resolve_first_name(n)
+
+    def warm(items):
+        for n in items:
+            resolve_first_name(n)
+
+    def batch(items):
+        clear_caches()
+        first_names_from_aria_labels(items)
+
+    cold_us = time_per_call(cold, names)
+    warm_us = time_per_call(warm, names)
+    batch_us = time_per_call(batch, labels)
+    return cold_us, warm_us, batch_us
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Micro-benchmark first-name resolution")
+    parser.add_argument("--names", type=int, default=100000, help="Corpus size (default: 100000)")
+    parser.add_argument("--extra-given-names", type=int, default=5000,
+                        help="Synthetic entries added to the given-name list for the growth run (default: 5000)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    names = build_corpus(args.names)
+    labels = [f"Invite {n} to connect" for n in names]
+    print(f"Corpus: {len(names)} names, {len(set(names))} distinct")
+
+    print(f"{'given names':>12}{'cold us/name':>15}{'warm us/name':>15}{'batch us/label':>17}")
+    set_name_locales(("pt",))
+    cold_us, warm_us, batch_us = run(names, labels)
+    print(f"{len(main.name_dictionary):>12}{cold_us:>15.3f}{warm_us:>15.3f}{batch_us:>17.3f}")
+
+    padded_dir = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(NAMES_DIR, "pt.txt"), "r", encoding="utf-8") as f:
+            words = f.read().split()
+        words += [f"given{i:05d}" for i in range(args.extra_given_names)]
+        write_word_list(words, os.path.join(padded_dir, "pt.txt"))
+        shutil.copy(os.path.join(NAMES_DIR, "pt.connectors.txt"), padded_dir)
+        set_name_locales(("pt",), padded_dir)
+        cold_us, warm_us, batch_us = run(names, labels)
+        print(f"{len(main.name_dictionary):>12}{cold_us:>15.3f}{warm_us:>15.3f}{batch_us:>17.3f}")
+    finally:
+        set_name_locales(("pt",))
+        shutil.rmtree(padded_dir, ignore_errors=True)
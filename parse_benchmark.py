@@ -0,0 +1,147 @@
+"""Benchmark and check the offline search-results parser.
+
+Parses the saved result pages in examples/ (the older
+search-results-container layout and the current role="listitem" one) with
+parse_search_results(), using lxml and the standard library's html.parser,
+checks that both give the same rows and times them.
+
+With --browser the same files are also opened in headless Chrome and three
+ways of reading a page are timed against each other:
+
+- webdriver: find_elements for the Connect controls, then get_attribute and
+  extract_name_from_profile() (the parent-walking loop) per control;
+- snapshot: the CANDIDATES_JS snapshot (one execute_script call);
+- page_source: one driver.page_source fetch parsed with parse_search_results().
+
+The page_source rows are checked against the CANDIDATES_JS snapshot.
+
+Usage:
+    python parse_benchmark.py
+    python parse_benchmark.py --repeat 50 --browser
+"""
+import argparse
+import os
+import time
+
+import main
+from main import By, LinkedInAutomator, parse_search_results
+
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "examples")
+PAGES = ("search-results-container-old.html", "search-results-section-new.html")
+
+# Fields compared between the parser and the CANDIDATES_JS snapshot
+COMPARED_FIELDS = ("label", "href", "name", "state", "headline", "current")
+
+CONNECT_XPATH = ("//a[starts-with(@aria-label, 'Invite ') and contains(@aria-label, ' to connect')]"
+                 " | //button[starts-with(@aria-label, 'Invite ') and contains(@aria-label, ' to connect')]")
+
+
+def time_ms(fn, repeat):
+    """Best-of-`repeat` milliseconds for one call of fn(), and its last result."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, result
+
+
+def parse_with(backend, source):
+    """parse_search_results() forced to one backend ("lxml" or "html.parser")."""
+    saved = main.lxml
+    if backend == "html.parser":
+        main.lxml = None
+    try:
+        return parse_search_results(source)
+    finally:
+        main.lxml = saved
+
+
+def differences(expected, actual):
+    """Human-readable differences between two lists of candidate rows."""
+    if len(expected) != len(actual):
+        return [f"{len(expected)} rows expected, got {len(actual)}"]
+    out = []
+    for i, (want, got) in enumerate(zip(expected, actual)):
+        for field in COMPARED_FIELDS:
+            a = " ".join((want.get(field) or "").split())
+            b = " ".join((got.get(field) or "").split())
+            if a != b:
+                out.append(f"row {i} {field}: {a!r} != {b!r}")
+    return out
+
+
+def run_offline(repeat):
+    backends = ("lxml", "html.parser") if main.lxml is not None else ("html.parser",)
+    if main.lxml is None:
+        print("lxml is not installed; timing html.parser only (pip install lxml)")
+
+    print(f"{'page':<38}{'rows':>5}" + "".join(f"{b + ' ms':>16}" for b in backends))
+    for page in PAGES:
+        with open(os.path.join(EXAMPLES_DIR, page), "r", encoding="utf-8") as f:
+            source = f.read()
+        timings = []
+        results = {}
+        for backend in backends:
+            ms, results[backend] = time_ms(lambda: parse_with(backend, source), repeat)
+            timings.append(ms)
+        rows = results[backends[0]]
+        print(f"{page:<38}{len(rows):>5}" + "".join(f"{ms:>16.2f}" for ms in timings))
+        for problem in differences(rows, results[backends[-1]]):
+            print(f"  backends disagree: {problem}")
+        states = {}
+        for row in rows:
+            states[row["state"]] = states.get(row["state"], 0) + 1
+        print("  " + ", ".join(f"{n} {state}" for state, n in sorted(states.items())))
+
+
+def webdriver_walk(automator):
+    """The find_elements path: every Connect control's label and first name."""
+    out = []
+    for control in automator.driver.find_elements(By.XPATH, CONNECT_XPATH):
+        out.append((control.get_attribute("aria-label"), automator.extract_name_from_profile(control)))
+    return out
+
+
+def run_browser(repeat, headed):
+    automator = LinkedInAutomator(use_existing_browser=False, headless=not headed,
+                                  auto_continue=True, ledger_file=None, checkpoint_file=None,
+                                  click_stats_file=None, watch_message_file=False)
+    try:
+        print(f"\n{'page':<38}{'webdriver ms':>14}{'snapshot ms':>13}{'page_source ms':>16}")
+        for page in PAGES:
+            automator.driver.get("file://" + os.path.join(EXAMPLES_DIR, page))
+            walk_ms, walked = time_ms(lambda: webdriver_walk(automator), repeat)
+            snap_ms, snapshot = time_ms(automator.snapshot_candidates, repeat)
+            parse_ms, parsed = time_ms(automator.parse_candidates, repeat)
+            print(f"{page:<38}{walk_ms:>14.1f}{snap_ms:>13.1f}{parse_ms:>16.1f}")
+
+            # The old layout's <button> Connect controls are only picked up by the parser
+            if snapshot:
+                for problem in differences(snapshot, parsed):
+                    print(f"  page_source vs snapshot: {problem}")
+            walked_names = [first for _, first in walked]
+            parsed_names = [r["name"].split()[0] for r in parsed if r["state"] == "connect" and r["name"]]
+            if walked_names != parsed_names:
+                print(f"  first names differ: webdriver {walked_names} / page_source {parsed_names}")
+    finally:
+        automator.close()
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the offline search-results parser")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed repetitions per measurement (default: 20)")
+    parser.add_argument("--browser", action="store_true",
+                        help="Also compare against the WebDriver paths in headless Chrome")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window (with --browser)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    run_offline(args.repeat)
+    if args.browser:
+        run_browser(args.repeat, args.headed)
@@ -0,0 +1,395 @@
+"""Offline replay harness: a local stand-in for LinkedIn's people search.
+
+Serves fixture pages built from the saved markup in examples/ (search results,
+connect modal, note modal and the email-verification screen) from a tiny HTTP
+server, plus a small script that reproduces the bits of LinkedIn behaviour the
+bot depends on:
+
+- the Connect anchor opens the invite modal inside the #interop-outlet open
+  shadow root (after a configurable delay, like the real modal animation);
+- "Add a note" swaps in the note modal, whose Send button stays disabled until
+  the textarea receives input;
+- Send POSTs to a fake invitation endpoint whose URL contains the same
+  fragments as LinkedIn's, so performance-log based HTTP 429 detection works,
+  and turns the person's control into "Pending" on success;
+- pagination buttons load ?page=N, exactly like the search UI.
+
+Untrusted (JS) clicks on Connect/Send are ignored, as LinkedIn does, so the
+harness also exercises the trusted-click fallbacks in _robust_click.
+
+Usage:
+    python replay_harness.py                # 3 pages, headless Chrome
+    python replay_harness.py --pages 5 -n   # no-note mode
+    python replay_harness.py --quota 4      # answer HTTP 429 after 4 invites
+"""
+import argparse
+import json
+import logging
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from main import LinkedInAutomator, NAVIGATION_MODES, setup_logging, logger
+
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "examples")
+
+SEARCH_PATH = "/search/results/people/"
+INVITE_PATH = "/voyager/api/voyagerRelationshipsDashMemberRelationships"
+
+# Served for page numbers outside 1..pages, like LinkedIn's empty results page
+NO_RESULTS_HTML = ("<!DOCTYPE html><html><head><meta charset='utf-8'><title>Search | LinkedIn</title></head>"
+                   "<body><main><h2>No results found</h2></main></body></html>")
+INVITE_QUERY = "action=verifyQuotaAndCreate"
+
+# The modal markup sits between these two markers in the saved modal pages.
+_MODAL_START = '<div id="artdeco-modal-outlet" tabindex="-1">'
+_MODAL_END = '<div id="artdeco-hoverable-outlet">'
+
+_PROFILE_HREF = re.compile(r'(https://www\.linkedin\.com/in/[^/"?]+)/')
+_PAGE_INDICATOR = re.compile(r'aria-label="Page (\d+)" aria-current="(?:true|false)"')
+
+# Client-side behaviour of the fixture. Kept deliberately small: just enough
+# of LinkedIn's modal/pagination flow for the bot to run end-to-end.
+REPLAY_JS = r"""
+(function () {
+  "use strict";
+  var cfg = window.__REPLAY__;
+  var host = document.getElementById("interop-outlet");
+  var root = host.attachShadow({ mode: "open" });
+  root.innerHTML = '<div><div id="artdeco-modal-outlet" tabindex="-1"></div></div>';
+  var outlet = root.getElementById("artdeco-modal-outlet");
+  var current = null;
+
+  function escapeHtml(s) {
+    return s.replace(/[&<>"']/g, function (c) {
+      return { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" }[c];
+    });
+  }
+
+  function render(tpl) {
+    outlet.innerHTML = tpl.split("{{name}}").join(escapeHtml(current.name));
+  }
+
+  function closeModal() {
+    outlet.innerHTML = "";
+    current = null;
+  }
+
+  function openModal(anchor) {
+    var name = anchor.getAttribute("aria-label")
+      .replace(/^Invite\s+/, "").replace(/\s+to connect$/, "");
+    current = { anchor: anchor, name: name };
+    var tpl = cfg.emailGated.indexOf(name) >= 0 ? cfg.templates.emailGate : cfg.templates.connect;
+    setTimeout(function () { if (current) render(tpl); }, cfg.modalDelayMs);
+  }
+
+  function sendInvite() {
+    var sent = current;
+    var box = root.getElementById("custom-message");
+    fetch(cfg.inviteEndpoint, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ name: sent.name, note: box ? box.value : "" })
+    }).then(function (r) {
+      setTimeout(function () {
+        closeModal();
+        if (r.ok) {
+          sent.anchor.setAttribute("aria-label",
+            "Pending, click to withdraw invitation sent to " + sent.name);
+          sent.anchor.innerHTML = "<span><span>Pending</span></span>";
+        }
+      }, cfg.responseDelayMs);
+    }).catch(closeModal);
+  }
+
+  function goToPage(n) {
+    var url = new URL(location.href);
+    url.searchParams.set("page", String(n));
+    location.assign(url.toString());
+  }
+
+  document.addEventListener("click", function (e) {
+    var t = e.target;
+    if (!t.closest) return;
+    var anchor = t.closest("a[aria-label^='Invite '][aria-label$=' to connect']");
+    if (anchor) {
+      e.preventDefault();
+      if (e.isTrusted && !current) openModal(anchor);
+      return;
+    }
+    var nav = t.closest("button[data-testid^='pagination-']");
+    if (!nav) return;
+    var testid = nav.getAttribute("data-testid");
+    if (testid.indexOf("-hidden") >= 0) return;
+    if (testid.indexOf("pagination-controls-next") === 0) goToPage(cfg.page + 1);
+    else if (testid.indexOf("pagination-controls-prev") === 0) goToPage(cfg.page - 1);
+    else goToPage(parseInt(nav.getAttribute("aria-label").replace("Page ", ""), 10));
+  }, true);
+
+  root.addEventListener("click", function (e) {
+    var btn = e.target.closest && e.target.closest("button");
+    if (!btn || !current) return;
+    var label = btn.getAttribute("aria-label");
+    if (label === "Dismiss" || label === "Cancel adding a note") {
+      closeModal();
+    } else if (label === "Add a note") {
+      setTimeout(function () { if (current) render(cfg.templates.note); }, cfg.stepDelayMs);
+    } else if ((label === "Send without a note" || label === "Send invitation") && e.isTrusted) {
+      if (!btn.disabled) sendInvite();
+    }
+  });
+
+  root.addEventListener("input", function (e) {
+    if (e.target.id !== "custom-message") return;
+    var value = e.target.value || "";
+    var send = root.querySelector("button[aria-label='Send invitation']");
+    if (send) {
+      send.disabled = !value.trim();
+      send.classList.toggle("artdeco-button--disabled", send.disabled);
+    }
+    var counter = root.querySelector("span[aria-live='polite']");
+    if (counter) counter.textContent = value.length + "/300";
+  });
+})();
+"""
+
+
+def _read_example(name):
+    with open(os.path.join(EXAMPLES_DIR, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _extract_modal(html):
+    """Cut the invite modal markup out of a saved #interop-outlet dump."""
+    start = html.index(_MODAL_START) + len(_MODAL_START)
+    end = html.index(_MODAL_END, start)
+    return html[start:end]
+
+
+class ReplayHarness:
+    """Local HTTP server that replays LinkedIn's search + invite flow.
+
+    pages: number of result pages served (the Next button hides on the last).
+    email_gated: full names whose modal opens on the email-verification screen.
+    quota: invites accepted before the endpoint answers HTTP 429 (None = no limit).
+    modal_delay_ms / step_delay_ms / response_delay_ms simulate the UI latency
+    of opening the modal, switching to the note screen and the Send POST.
+    """
+
+    def __init__(self, pages=3, email_gated=("Keyllane Filgueira",), quota=None,
+                 modal_delay_ms=400, step_delay_ms=200, response_delay_ms=300,
+                 host="127.0.0.1", port=0):
+        self.pages = pages
+        self.email_gated = list(email_gated)
+        self.quota = quota
+        self.modal_delay_ms = modal_delay_ms
+        self.step_delay_ms = step_delay_ms
+        self.response_delay_ms = response_delay_ms
+        self.host = host
+        self.port = port
+
+        # Invitations received by the fake endpoint: dicts with name/note/status
+        self.invites = []
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+        self._section_html = _read_example("search-results-section-new.html")
+        connect_modal = _extract_modal(_read_example("connect-modal.html"))
+        connect_modal = re.sub(r"<strong>[^<]*</strong>", "<strong>{{name}}</strong>",
+                               connect_modal, count=1)
+        email_gate = re.sub(r'<p class="display-flex">.*?</p>',
+                            lambda _: _read_example("email-input.html"),
+                            connect_modal, count=1, flags=re.DOTALL)
+        self._templates = {
+            "connect": connect_modal,
+            "note": _extract_modal(_read_example("note-modal.html")),
+            "emailGate": email_gate,
+        }
+
+    # ------------------------------------------------------------------ server
+
+    def start(self):
+        """Start serving in a background thread; returns the base URL."""
+        harness = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, fmt, *args):
+                logger.debug("[replay] " + fmt % args)
+
+            def _reply(self, status, body, content_type):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path == SEARCH_PATH:
+                    page = int(parse_qs(url.query).get("page", ["1"])[0])
+                    if 1 <= page <= harness.pages:
+                        body = harness.render_search_page(page)
+                    else:
+                        body = NO_RESULTS_HTML  # what LinkedIn shows past the last page
+                    self._reply(200, body, "text/html; charset=utf-8")
+                elif url.path == "/replay.js":
+                    self._reply(200, REPLAY_JS, "application/javascript; charset=utf-8")
+                else:
+                    self._reply(404, "not found", "text/plain")
+
+            def do_POST(self):
+                url = urlparse(self.path)
+                if url.path != INVITE_PATH:
+                    self._reply(404, "not found", "text/plain")
+                    return
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    payload = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    payload = {}
+                status = harness.record_invite(payload)
+                body = (json.dumps({"value": {"invitationUrn": f"urn:li:invitation:{len(harness.invites)}"}})
+                        if status == 200 else json.dumps({"status": 429}))
+                self._reply(status, body, "application/json")
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name="replay-harness", daemon=True)
+        self._thread.start()
+        logger.info(f"Replay harness serving {self.pages} page(s) at {self.base_url}")
+        return self.base_url
+
+    def stop(self):
+        """Shut the server down."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def url(self, page=1):
+        """URL of the given search results page."""
+        return f"{self.base_url}{SEARCH_PATH}?keywords=recruiter&origin=FACETED_SEARCH&page={page}"
+
+    def record_invite(self, payload):
+        """Register a POST to the invite endpoint; returns the HTTP status to send."""
+        with self._lock:
+            accepted = sum(1 for i in self.invites if i["status"] == 200)
+            status = 429 if self.quota is not None and accepted >= self.quota else 200
+            self.invites.append({"name": payload.get("name"), "note": payload.get("note", ""),
+                                 "status": status})
+            return status
+
+    # --------------------------------------------------------------- fixtures
+
+    def render_search_page(self, page):
+        """Build search results page N from the saved new-layout section."""
+        html = self._section_html
+        prev_state = "hidden" if page <= 1 else "visible"
+        next_state = "hidden" if page >= self.pages else "visible"
+        html = html.replace('data-testid="pagination-controls-prev-button-hidden"',
+                            f'data-testid="pagination-controls-prev-button-{prev_state}"')
+        html = html.replace('data-testid="pagination-controls-next-button-visible"',
+                            f'data-testid="pagination-controls-next-button-{next_state}"')
+        html = _PAGE_INDICATOR.sub(
+            lambda m: f'aria-label="Page {m.group(1)}" '
+                      f'aria-current="{"true" if int(m.group(1)) == page else "false"}"', html)
+        # Give every page its own profile URLs so pages look like distinct people
+        if page > 1:
+            html = _PROFILE_HREF.sub(lambda m: f"{m.group(1)}-p{page}/", html)
+
+        config = {
+            "page": page,
+            "pages": self.pages,
+            "emailGated": self.email_gated,
+            "modalDelayMs": self.modal_delay_ms,
+            "stepDelayMs": self.step_delay_ms,
+            "responseDelayMs": self.response_delay_ms,
+            "inviteEndpoint": f"{INVITE_PATH}?{INVITE_QUERY}",
+            "templates": self._templates,
+        }
+        # Escape "</" so template markup can't close the inline <script> early
+        config_json = json.dumps(config).replace("</", "<\\/")
+        return (
+            "<!DOCTYPE html><html lang=\"en\"><head><meta charset=\"utf-8\">"
+            f"<title>Search | Replay page {page}</title></head><body><main>"
+            f"{html}</main>"
+            "<div id=\"interop-outlet\" data-testid=\"interop-shadowdom\"></div>"
+            f"<script>window.__REPLAY__ = {config_json};</script>"
+            "<script src=\"/replay.js\"></script></body></html>")
+
+
+def run_replay(automator, harness, max_pages=None):
+    """Drive process_page()/go_to_next_page() across the fixture pages.
+
+    Returns the number of pages processed.
+    """
+    max_pages = max_pages or harness.pages
+    automator.driver.get(harness.url(max_pages if automator.reverse else 1))
+    page_num = 1
+    while True:
+        logger.info(f"--- [replay] Processing page {page_num} ---")
+        if not automator.process_page():
+            logger.info("[replay] process_page() asked to stop.")
+            break
+        if page_num >= max_pages or automator.go_to_next_page() != "moved":
+            break
+        page_num += 1
+    return page_num
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run the bot against the offline LinkedIn replay harness")
+    parser.add_argument("--pages", type=int, default=3, help="Number of result pages to serve (default: 3)")
+    parser.add_argument("--quota", type=int, default=None,
+                        help="Answer HTTP 429 after this many invites (default: unlimited)")
+    parser.add_argument("--port", type=int, default=0, help="Port to listen on (default: random free port)")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    parser.add_argument("-m", "--message", default="message.txt",
+                        help="Path to message template file (default: message.txt)")
+    parser.add_argument("-r", "--reverse", action="store_true", help="Start on the last page and go backwards")
+    parser.add_argument("-n", "--no-message", action="store_true", help="Send invitations without a note")
+    parser.add_argument("--navigation", default="url", choices=NAVIGATION_MODES,
+                        help="How the bot changes pages (default: url)")
+    parser.add_argument("--ledger", default=None,
+                        help="Invitation ledger file to use (default: none, so every run starts fresh)")
+    parser.add_argument("-l", "--log-level", default="INFO", choices=["DEBUG", "INFO", "WARN", "ERROR"],
+                        help="Console/file log verbosity (default: INFO)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    level_name = "WARNING" if args.log_level == "WARN" else args.log_level
+    setup_logging(level=getattr(logging, level_name, logging.INFO))
+
+    harness = ReplayHarness(pages=args.pages, quota=args.quota, port=args.port)
+    harness.start()
+    automator = LinkedInAutomator(use_existing_browser=False, headless=not args.headed,
+                                  auto_continue=True, message_file=args.message,
+                                  reverse=args.reverse, no_message=args.no_message,
+                                  ledger_file=args.ledger, checkpoint_file=None,
+                                  click_stats_file=None, navigation=args.navigation)
+    try:
+        pages = run_replay(automator, harness)
+        accepted = sum(1 for i in harness.invites if i["status"] == 200)
+        logger.info(f"[replay] Done: {pages} page(s), endpoint received {len(harness.invites)} "
+                    f"invite(s) ({accepted} accepted).")
+        logger.info(
+            f"Session summary — sent: {automator.connections_sent} | "
+            f"failed to register: {automator.connections_failed} | "
+            f"skipped (email/modal issues): {automator.connections_skipped}")
+    finally:
+        automator.close()
+        harness.stop()